@@ -87,8 +87,10 @@ async def discover_contacts(limit: int = None, use_linkedin: bool = False):
             # Capture stdout and send to queue
             class QueueWriter:
                 def write(self, text):
-                    if text.strip():
-                        progress_queue.put(text.rstrip())
+                    # Output may arrive as multi-line blocks; queue per line
+                    for line in text.rstrip().splitlines():
+                        if line.strip():
+                            progress_queue.put(line)
 
                 def flush(self):
                     pass
@@ -172,8 +174,10 @@ async def dork_companies(platform: str):
             # Capture stdout
             class QueueWriter:
                 def write(self, text):
-                    if text.strip():
-                        progress_queue.put(text.rstrip())
+                    # Output may arrive as multi-line blocks; queue per line
+                    for line in text.rstrip().splitlines():
+                        if line.strip():
+                            progress_queue.put(line)
 
                 def flush(self):
                     pass
@@ -13,25 +13,26 @@ Two-stage filtering:
 """
 
 import asyncio
-import json
 import os
 import time
 from pathlib import Path
 from typing import Callable, Any
 
+import orjson
 from anthropic import Anthropic
 
 from . import register
 
 # Import filter logic from src/filters via sys.path (set up in __init__.py)
 from filters.filter_jobs import (
-    should_reject_with_regex,
-    is_intern_only,
+    classify_title,
+    is_non_us_location,
     batch_jobs,
     evaluate_batch_with_haiku,
     review_batch_with_sonnet,
     BATCH_SIZE,
     SONNET_BATCH_SIZE,
+    API_MAX_RETRIES,
 )
 
 PROFILE_PATH = Path(__file__).parent.parent.parent / "profile.json"
@@ -129,7 +130,7 @@ async def handle_filter(args: str):
     review_jobs = list(pending_reviews)  # Start with pending reviews from DB
 
     # Create Anthropic client (needed for both stages)
-    client = Anthropic(api_key=api_key)
+    client = Anthropic(api_key=api_key, max_retries=API_MAX_RETRIES)
 
     # Only run Stage 0/1 if there are new unevaluated jobs
     if jobs:
@@ -140,15 +141,12 @@ async def handle_filter(args: str):
 
         potentially_relevant = []
         for job in jobs:
-            # Detect intern-only jobs
-            intern_only = is_intern_only(job['job_title'])
+            # Check title for rejection keywords and intern-only in one scan;
+            # location only matters for jobs that survive
+            reason, intern_only = classify_title(job['job_title'])
+            is_non_us = False if reason else is_non_us_location(job.get('location'))[0]
 
-            # Check if should reject based on regex
-            should_reject, reason, is_non_us = should_reject_with_regex(
-                job['job_title'], job.get('location')
-            )
-
-            if should_reject:
+            if reason:
                 regex_rejected.append({
                     'job_id': job['id'],
                     'decision': 'REJECT',
@@ -203,13 +201,15 @@ async def handle_filter(args: str):
                 batch_review = 0
                 batch_rejected = 0
                 evaluated_job_ids = []
+                targets = []
+                jobs_by_id = {j['id']: j for j in batch}
 
                 for result in results:
                     job_id = result.get('job_id')
                     decision = result.get('decision', 'REJECT')
 
                     # Find original job data
-                    job = next((j for j in batch if j['id'] == job_id), None)
+                    job = jobs_by_id.get(job_id)
                     if job:
                         result['is_intern'] = job.get('is_intern', False)
                         result['is_non_us'] = job.get('is_non_us', False)
@@ -225,27 +225,29 @@ async def handle_filter(args: str):
                         batch_accepted += 1
                         evaluated_job_ids.append(job_id)
                         # Insert into target_jobs with status=1 (pending)
-                        await jobs_db.insert_target_job(
-                            job_id=job_id,
-                            relevance_score=result.get('score', 0.7),
-                            match_reason=result.get('reasoning', ''),
-                            priority=priority,
-                            is_intern=result.get('is_intern', False),
-                            experience_analysis=experience_info
-                        )
+                        targets.append({
+                            'job_id': job_id,
+                            'relevance_score': result.get('score', 0.7),
+                            'match_reason': result.get('reasoning', ''),
+                            'status': 1,
+                            'priority': priority,
+                            'is_intern': result.get('is_intern', False),
+                            'experience_analysis': experience_info,
+                        })
 
                     elif decision == 'REVIEW':
                         batch_review += 1
                         evaluated_job_ids.append(job_id)  # Mark as evaluated NOW
                         # Insert into target_jobs with status=0 (pending review)
-                        await jobs_db.insert_review_job(
-                            job_id=job_id,
-                            relevance_score=result.get('score', 0.5),
-                            match_reason=result.get('reasoning', ''),
-                            priority=priority,
-                            is_intern=result.get('is_intern', False),
-                            experience_analysis=experience_info
-                        )
+                        targets.append({
+                            'job_id': job_id,
+                            'relevance_score': result.get('score', 0.5),
+                            'match_reason': result.get('reasoning', ''),
+                            'status': 0,
+                            'priority': priority,
+                            'is_intern': result.get('is_intern', False),
+                            'experience_analysis': experience_info,
+                        })
                         # Add to review_jobs for Stage 2 in this run
                         if job:
                             review_jobs.append({
@@ -258,8 +260,9 @@ async def handle_filter(args: str):
                         batch_rejected += 1
                         evaluated_job_ids.append(job_id)
 
-                # Mark all processed jobs as evaluated
-                await jobs_db.mark_jobs_evaluated(evaluated_job_ids)
+                # Insert targets and mark all processed jobs as evaluated
+                # in one transaction per batch
+                await jobs_db.save_filter_batch(targets, evaluated_job_ids)
 
                 total_accepted += batch_accepted
                 total_review += batch_review
@@ -282,8 +285,9 @@ async def handle_filter(args: str):
 
         # Load profile
         try:
-            with open(PROFILE_PATH, 'r') as f:
-                profile = json.load(f)
+            # Serialized once for every Sonnet batch
+            with open(PROFILE_PATH, 'rb') as f:
+                profile_json = orjson.dumps(orjson.loads(f.read())).decode()
         except FileNotFoundError:
             yield {"type": "error", "text": f"Profile not found at {PROFILE_PATH}"}
             return
@@ -295,7 +299,7 @@ async def handle_filter(args: str):
         sonnet_start = time.time()
 
         async for batch_num, batch, results, error in run_parallel_batches(
-            sonnet_batches, review_batch_with_sonnet, MAX_SONNET_CONCURRENT, client, profile
+            sonnet_batches, review_batch_with_sonnet, MAX_SONNET_CONCURRENT, client, profile_json
         ):
             completed_sonnet += 1
 
@@ -307,26 +311,24 @@ async def handle_filter(args: str):
                 yield {"type": "progress", "text": f"  ✗ Batch {batch_num+1}/{num_sonnet_batches} returned no results"}
                 continue
 
-            batch_accepted = 0
-            batch_rejected = 0
+            # Accepted rows move from status 0 (pending_review) to 1 (pending);
+            # rejected rows are deleted from target_jobs
+            accepted = []
+            rejected_ids = []
 
             for result in results:
-                job_id = result.get('job_id')
-                decision = result.get('decision', 'REJECT')
-
-                if decision == 'ACCEPT':
-                    batch_accepted += 1
-                    # Update status from 0 (pending_review) to 1 (pending)
-                    await jobs_db.finalize_review_job(
-                        job_id=job_id,
-                        accept=True,
-                        new_score=result.get('score', 0.6),
-                        new_reason=f"Sonnet: {result.get('reasoning', '')}"
-                    )
+                if result.get('decision', 'REJECT') == 'ACCEPT':
+                    accepted.append({
+                        'job_id': result.get('job_id'),
+                        'relevance_score': result.get('score', 0.6),
+                        'match_reason': f"Sonnet: {result.get('reasoning', '')}",
+                    })
                 else:
-                    batch_rejected += 1
-                    # Delete from target_jobs (rejected)
-                    await jobs_db.finalize_review_job(job_id=job_id, accept=False)
+                    rejected_ids.append(result.get('job_id'))
+
+            await jobs_db.finalize_review_batch(accepted, rejected_ids)
+            batch_accepted = len(accepted)
+            batch_rejected = len(rejected_ids)
 
             sonnet_accepted += batch_accepted
             sonnet_rejected += batch_rejected
@@ -9,6 +9,7 @@ import os
 from datetime import datetime, timezone
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
 
 # Load .env from parent directory
@@ -17,7 +18,7 @@ load_dotenv(env_path)
 
 from sqlalchemy import (
     Column, String, Text, Integer, Float, Boolean, DateTime,
-    ForeignKey, Index, select, func
+    ForeignKey, Index, select, func, update, delete, bindparam, event
 )
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import DeclarativeBase, relationship
@@ -143,7 +144,8 @@ Index('idx_ats_platform', Company.ats_platform)
 Index('idx_discovery_source', Company.discovery_source)
 Index('idx_ats_slug', Company.ats_slug)
 Index('idx_target_job_id', TargetJob.job_id)
-Index('idx_status', TargetJob.status)
+# Serves status filters and the pending-targets ORDER BY priority, score
+Index('idx_status_priority_score', TargetJob.status, TargetJob.priority, TargetJob.relevance_score.desc())
 Index('idx_contact_company', Contact.company_id)
 Index('idx_contact_priority', Contact.is_priority)
 Index('idx_message_company', OutreachMessage.company_id)
@@ -181,11 +183,31 @@ def get_jobs_database_url() -> str:
     return f"sqlite+aiosqlite:///{jobs_db_path}"
 
 
+# Applied to every local SQLite connection, matching src/utils/jobs_db_conn.py:
+# WAL lets the src/ scripts read while the agent writes (and vice versa),
+# and busy_timeout waits out the other writer instead of raising
+# "database is locked"
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",     # 30 s
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+)
+
 # Global engine and session factory
 jobs_engine = None
 jobs_session_factory = None
 
 
+def _set_sqlite_pragmas(dbapi_conn, connection_record):
+    """Engine connect hook: tune each new SQLite connection."""
+    cursor = dbapi_conn.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
+
 async def init_jobs_db():
     """Initialize jobs database engine and create tables."""
     global jobs_engine, jobs_session_factory
@@ -199,6 +221,8 @@ async def init_jobs_db():
         db_path.parent.mkdir(parents=True, exist_ok=True)
 
     jobs_engine = create_async_engine(db_url, echo=False)
+    if "sqlite" in db_url:
+        event.listen(jobs_engine.sync_engine, "connect", _set_sqlite_pragmas)
     jobs_session_factory = async_sessionmaker(jobs_engine, expire_on_commit=False)
 
     # Create tables
@@ -487,8 +511,6 @@ async def insert_target_job(
 
     Returns TargetJob if inserted, None if already exists (duplicate).
     """
-    import json
-
     async with jobs_session_factory() as db:
         # Check if already exists
         result = await db.execute(
@@ -505,7 +527,7 @@ async def insert_target_job(
             status=1,  # pending
             priority=priority,
             is_intern=is_intern,
-            experience_analysis=json.dumps(experience_analysis) if experience_analysis else None
+            experience_analysis=orjson.dumps(experience_analysis).decode() if experience_analysis else None
         )
         db.add(target)
         await db.commit()
@@ -519,18 +541,56 @@ async def mark_jobs_evaluated(job_ids: list[int]) -> int:
         return 0
 
     async with jobs_session_factory() as db:
+        # One UPDATE statement instead of loading each Job row
         result = await db.execute(
-            select(Job).where(Job.id.in_(job_ids))
+            update(Job).where(Job.id.in_(job_ids)).values(evaluated=True)
         )
-        jobs = result.scalars().all()
+        await db.commit()
+        return result.rowcount
 
-        count = 0
-        for job in jobs:
-            job.evaluated = True
-            count += 1
+
+async def save_filter_batch(targets: list[dict], evaluated_job_ids: list[int]) -> int:
+    """Insert a batch of target_jobs rows and mark its jobs evaluated in one transaction.
+
+    Each target dict holds the insert_target_job() fields plus status
+    (1 = pending, 0 = pending Sonnet review). Targets whose job_id is
+    already in target_jobs, or repeated earlier in the batch, are skipped.
+
+    Returns count of target_jobs rows inserted.
+    """
+    async with jobs_session_factory() as db:
+        # One lookup for the whole batch instead of one per target
+        existing = set()
+        if targets:
+            result = await db.execute(
+                select(TargetJob.job_id).where(TargetJob.job_id.in_([t["job_id"] for t in targets]))
+            )
+            existing = set(result.scalars().all())
+
+        new_targets = []
+        for t in targets:
+            # Also skips a job_id repeated within the batch (first copy wins)
+            if t["job_id"] in existing:
+                continue
+            existing.add(t["job_id"])
+            new_targets.append(TargetJob(
+                job_id=t["job_id"],
+                relevance_score=t["relevance_score"],
+                match_reason=t["match_reason"],
+                status=t["status"],
+                priority=t.get("priority", 1),
+                is_intern=t.get("is_intern", False),
+                experience_analysis=orjson.dumps(t["experience_analysis"]).decode() if t.get("experience_analysis") else None
+            ))
+        db.add_all(new_targets)
+
+        if evaluated_job_ids:
+            await db.execute(
+                update(Job).where(Job.id.in_(evaluated_job_ids)).values(evaluated=True)
+            )
 
         await db.commit()
-        return count
+        return len(new_targets)
 
 
 async def reset_evaluated() -> int:
@@ -576,8 +636,6 @@ async def insert_review_job(
 
     Returns TargetJob if inserted, None if already exists.
     """
-    import json
-
     async with jobs_session_factory() as db:
         # Check if already exists
         result = await db.execute(
@@ -594,7 +652,7 @@ async def insert_review_job(
             status=0,  # pending_review (waiting for Sonnet)
             priority=priority,
             is_intern=is_intern,
-            experience_analysis=json.dumps(experience_analysis) if experience_analysis else None
+            experience_analysis=orjson.dumps(experience_analysis).decode() if experience_analysis else None
         )
         db.add(target)
         await db.commit()
@@ -678,6 +736,40 @@ async def finalize_review_job(job_id: int, accept: bool, new_score: float = None
         return True
 
 
+async def finalize_review_batch(accepted: list[dict], rejected_job_ids: list[int]) -> int:
+    """Finalize a batch of Sonnet decisions in one transaction.
+
+    Same effect as finalize_review_job() per job: each accepted dict
+    (job_id, relevance_score, match_reason) moves its row to status 1 with
+    the new score/reason, and rejected rows are deleted. Uses one
+    executemany UPDATE and one DELETE instead of a lookup per job.
+
+    Returns count of rows updated or deleted.
+    """
+    count = 0
+    async with jobs_session_factory() as db:
+        if accepted:
+            # Core table so a list of params runs as executemany keyed on job_id
+            table = TargetJob.__table__
+            result = await db.execute(
+                update(table)
+                .where(table.c.job_id == bindparam("b_job_id"))
+                .values(status=1, relevance_score=bindparam("b_score"), match_reason=bindparam("b_reason")),
+                [
+                    {"b_job_id": t["job_id"], "b_score": t["relevance_score"], "b_reason": t["match_reason"]}
+                    for t in accepted
+                ]
+            )
+            count += result.rowcount
+        if rejected_job_ids:
+            result = await db.execute(
+                delete(TargetJob).where(TargetJob.job_id.in_(rejected_job_ids))
+            )
+            count += result.rowcount
+        await db.commit()
+    return count
+
+
 # View data for pipeline viewer
 
 STAGE_CONFIGS = {
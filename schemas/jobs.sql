@@ -121,7 +121,8 @@ CREATE INDEX IF NOT EXISTS idx_ats_platform ON companies(ats_platform);
 CREATE INDEX IF NOT EXISTS idx_discovery_source ON companies(discovery_source);
 CREATE INDEX IF NOT EXISTS idx_ats_slug ON companies(ats_slug);
 CREATE INDEX IF NOT EXISTS idx_target_job_id ON target_jobs(job_id);
-CREATE INDEX IF NOT EXISTS idx_status ON target_jobs(status);
+-- Serves status filters and the pending-targets ORDER BY priority, score
+CREATE INDEX IF NOT EXISTS idx_status_priority_score ON target_jobs(status, priority, relevance_score DESC);
 CREATE INDEX IF NOT EXISTS idx_contact_company ON contacts(company_id);
 CREATE INDEX IF NOT EXISTS idx_contact_priority ON contacts(is_priority);
 CREATE INDEX IF NOT EXISTS idx_message_company ON messages(company_id);
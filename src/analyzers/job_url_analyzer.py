@@ -18,8 +18,8 @@ Usage:
 
 import os
 import sys
-import json
 import argparse
+import orjson
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
@@ -94,12 +94,12 @@ def analyze_job_url(url: str) -> dict:
         elif "```" in result_text:
             result_text = result_text.split("```")[1].split("```")[0]
 
-        result = json.loads(result_text.strip())
+        result = orjson.loads(result_text.strip())
         result["source_url"] = url
         result["analysis_success"] = True
         return result
 
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         return {
             "source_url": url,
             "analysis_success": False,
@@ -122,14 +122,12 @@ def load_pending_jobs() -> list[dict]:
     """Load pending jobs from JSON file."""
     if not PENDING_JOBS_FILE.exists():
         return []
-    with open(PENDING_JOBS_FILE) as f:
-        return json.load(f)
+    return orjson.loads(PENDING_JOBS_FILE.read_bytes())
 
 
 def save_pending_jobs(jobs: list[dict]):
     """Save pending jobs to JSON file."""
-    with open(PENDING_JOBS_FILE, 'w') as f:
-        json.dump(jobs, f, indent=2)
+    PENDING_JOBS_FILE.write_bytes(orjson.dumps(jobs, option=orjson.OPT_INDENT_2))
 
 
 def queue_job_lead(company_id: int, job_url: str, source: str):
@@ -387,7 +385,7 @@ def main():
 
     elif args.url:
         result = analyze_job_url(args.url)
-        print(json.dumps(result, indent=2))
+        print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
 
     else:
         parser.print_help()
@@ -9,10 +9,9 @@ We probe ATS APIs to discover which platforms companies use.
 """
 
 import re
-import requests
 
 from .types import CompanyLead, AggregatorResult
-from .utils import probe_companies_parallel, SUPPORTED_ATS
+from .utils import probe_companies_parallel, SUPPORTED_ATS, session
 
 
 A16Z_URL = "https://a16z.com/investment-list/"
@@ -47,7 +46,7 @@ class A16ZAggregator:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(A16Z_URL, headers=headers, timeout=30)
+        response = session.get(A16Z_URL, headers=headers, timeout=30)
         response.raise_for_status()
         html = response.text
         print(f"  ✓ Downloaded ({len(html):,} bytes)")
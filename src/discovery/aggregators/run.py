@@ -21,7 +21,7 @@ from pathlib import Path
 src_path = Path(__file__).parent.parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
-from utils.jobs_db_conn import get_connection, is_remote
+from utils.jobs_db_conn import get_connection, shared_connection, is_remote
 
 from .types import CompanyLead, JobLead, AggregatorResult
 from .utils import extract_slug_from_ats_url, SUPPORTED_ATS
@@ -74,23 +74,22 @@ def store_companies(companies: list[CompanyLead], source: str) -> dict:
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        for i, company in enumerate(companies):
-            # Check if company exists
-            cursor.execute(f"SELECT id FROM companies WHERE name = {p}", (company.name,))
-            existing = cursor.fetchone()
+        # One SELECT up front instead of an existence probe per company
+        cursor.execute("SELECT name FROM companies")
+        existing_names = {row['name'] for row in cursor.fetchall()}
 
-            if existing:
+        rows = []
+        for company in companies:
+            if company.name in existing_names:
                 stats['existed'] += 1
                 continue
+            existing_names.add(company.name)
 
             # Extract slug from ATS URL
             ats_slug = extract_slug_from_ats_url(company.ats_platform, company.ats_url)
             is_active = company.ats_platform in SUPPORTED_ATS
 
-            cursor.execute(f"""
-                INSERT INTO companies (name, discovery_source, ats_platform, ats_slug, ats_url, website, is_active)
-                VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
-            """, (
+            rows.append((
                 company.name,
                 source,
                 company.ats_platform,
@@ -111,10 +110,14 @@ def store_companies(companies: list[CompanyLead], source: str) -> dict:
             else:
                 stats['unsupported_ats'] += 1
 
-            # Progress every 100 companies
-            processed = i + 1
-            if processed % 100 == 0:
-                print(f"  [{processed}/{len(companies)}] {stats['added']} added, {stats['existed']} existed...")
+        # All inserts go out in one executemany and commit as one transaction
+        if rows:
+            cursor.executemany(f"""
+                INSERT INTO companies (name, discovery_source, ats_platform, ats_slug, ats_url, website, is_active)
+                VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
+            """, rows)
+
+        print(f"  {stats['added']} added, {stats['existed']} existed")
 
     print(f"  ✓ Done storing companies")
     return stats
@@ -134,18 +137,17 @@ def queue_jobs(jobs: list[JobLead], source: str) -> int:
     if not jobs:
         return 0
 
-    p = _placeholder()
-    job_leads = []
-
-    # Get company IDs for the job leads
-    with get_connection() as conn:
+    # Get company IDs for the job leads with one name -> id lookup
+    with get_connection(readonly=True) as conn:
         cursor = conn.cursor()
+        cursor.execute("SELECT id, name FROM companies")
+        company_ids = {row['name']: row['id'] for row in cursor.fetchall()}
 
-        for job in jobs:
-            cursor.execute(f"SELECT id FROM companies WHERE name = {p}", (job.company_name,))
-            result = cursor.fetchone()
-            if result:
-                job_leads.append((result['id'], job.job_url))
+    job_leads = [
+        (company_ids[job.company_name], job.job_url)
+        for job in jobs
+        if job.company_name in company_ids
+    ]
 
     if not job_leads:
         return 0
@@ -198,9 +200,10 @@ def run_aggregator(name: str, **options) -> dict:
 
     result = aggregator.fetch()
 
-    # Store results
-    company_stats = store_companies(result.companies, source=aggregator.name)
-    jobs_queued = queue_jobs(result.jobs, source=aggregator.name)
+    # Store results over one connection (company inserts + lead lookups)
+    with shared_connection():
+        company_stats = store_companies(result.companies, source=aggregator.name)
+        jobs_queued = queue_jobs(result.jobs, source=aggregator.name)
 
     # Print summary
     print(f"\n{'=' * 60}")
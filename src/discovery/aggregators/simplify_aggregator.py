@@ -11,11 +11,9 @@ For unsupported ATS (Workday, Oracle, etc.):
 - Returns JobLead for later Sonnet analysis
 """
 
-import requests
-from bs4 import BeautifulSoup
 
 from .types import CompanyLead, JobLead, AggregatorResult
-from .utils import detect_ats_from_url, extract_clean_website, SUPPORTED_ATS
+from .utils import detect_ats_from_url, extract_clean_website, SUPPORTED_ATS, session
 
 
 SIMPLIFY_README_URL = "https://raw.githubusercontent.com/SimplifyJobs/New-Grad-Positions/dev/README.md"
@@ -37,7 +35,7 @@ class SimplifyAggregator:
         """
         print("Fetching Simplify Jobs README...")
         print(f"  URL: {SIMPLIFY_README_URL}")
-        response = requests.get(SIMPLIFY_README_URL, timeout=30)
+        response = session.get(SIMPLIFY_README_URL, timeout=30)
         response.raise_for_status()
         print(f"  ✓ Downloaded ({len(response.text):,} bytes)")
 
@@ -46,7 +44,10 @@ class SimplifyAggregator:
         seen_companies = set()  # Dedupe by company name
         ats_counts = {}  # Track ATS platform distribution
 
-        # Parse markdown table
+        # Parse markdown table. bs4 is only needed here, so import it lazily
+        # rather than on every aggregators package import
+        from bs4 import BeautifulSoup
+
         print("Parsing job listings table...")
         soup = BeautifulSoup(response.text, 'html.parser')
         rows = soup.find_all('tr')
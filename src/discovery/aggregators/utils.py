@@ -7,6 +7,8 @@ Provides ATS detection, URL parsing, and probing functions.
 import re
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import urlparse
 from typing import Optional
 from concurrent.futures import ThreadPoolExecutor, as_completed
@@ -28,6 +30,43 @@ ATS_PATTERNS = {
 # ATS platforms we can scrape via API
 SUPPORTED_ATS = {'greenhouse', 'lever', 'ashbyhq'}
 
+# Lookup tables for detect_ats_from_url(), built once at import: one regex
+# finds any known ATS domain, the dict maps it back to its platform
+_ATS_DOMAINS = {
+    pattern: ats_platform
+    for ats_platform, patterns in ATS_PATTERNS.items()
+    for pattern in patterns
+}
+_ATS_DOMAIN_PATTERN = re.compile('|'.join(
+    re.escape(pattern) for pattern in sorted(_ATS_DOMAINS, key=len, reverse=True)
+))
+
+# Supported ATS: (slug regex on the job URL, normalized board URL template)
+_ATS_SLUG_PATTERNS = {
+    'greenhouse': (re.compile(r'greenhouse\.io/([^/]+)'), "https://boards.greenhouse.io/{}"),
+    'lever': (re.compile(r'lever\.co/([^/]+)'), "https://jobs.lever.co/{}"),
+    'ashbyhq': (re.compile(r'ashbyhq\.com/([^/]+)'), "https://jobs.ashbyhq.com/{}"),
+}
+
+# Shared session for aggregator downloads and ATS API probes.
+# probe_companies_parallel() runs up to 30 threads against the same three API
+# hosts, so keep enough pooled keep-alive connections per host that workers
+# don't redo TLS handshakes. Rate limits and transient 5xx are retried with
+# backoff (a 429 would otherwise read as "no ATS"); read timeouts are not, so
+# a slow probe can't multiply its timeout.
+session = requests.Session()
+session.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=64,
+    max_retries=Retry(
+        total=3,
+        read=0,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        raise_on_status=False,
+    ),
+))
+
 
 def detect_ats_from_url(job_url: str) -> tuple[str, str | None]:
     """
@@ -47,27 +86,18 @@ def detect_ats_from_url(job_url: str) -> tuple[str, str | None]:
     parsed = urlparse(job_url)
     domain = parsed.netloc.lower()
 
-    for ats_platform, patterns in ATS_PATTERNS.items():
-        for pattern in patterns:
-            if pattern in domain:
-                if ats_platform == 'greenhouse':
-                    match = re.search(r'greenhouse\.io/([^/]+)', job_url)
-                    if match:
-                        return ats_platform, f"https://boards.greenhouse.io/{match.group(1)}"
+    match = _ATS_DOMAIN_PATTERN.search(domain)
+    if match:
+        ats_platform = _ATS_DOMAINS[match.group()]
 
-                elif ats_platform == 'lever':
-                    match = re.search(r'lever\.co/([^/]+)', job_url)
-                    if match:
-                        return ats_platform, f"https://jobs.lever.co/{match.group(1)}"
+        if ats_platform not in _ATS_SLUG_PATTERNS:
+            # Unsupported ATS - return platform name but original URL
+            return ats_platform, job_url
 
-                elif ats_platform == 'ashbyhq':
-                    match = re.search(r'ashbyhq\.com/([^/]+)', job_url)
-                    if match:
-                        return ats_platform, f"https://jobs.ashbyhq.com/{match.group(1)}"
-
-                else:
-                    # Unsupported ATS - return platform name but original URL
-                    return ats_platform, job_url
+        slug_pattern, board_url = _ATS_SLUG_PATTERNS[ats_platform]
+        slug_match = slug_pattern.search(job_url)
+        if slug_match:
+            return ats_platform, board_url.format(slug_match.group(1))
 
     return 'unknown', job_url
 
@@ -110,6 +140,22 @@ def extract_clean_website(job_url: str) -> str | None:
     return None
 
 
+# Slug variations for generate_slugs(): each table does one variant's
+# replacements in a single C-level pass instead of chained str.replace()
+_SLUG_TRANSLATIONS = [
+    str.maketrans({' ': '-'}),
+    str.maketrans({' ': None}),
+    str.maketrans({' ': '-', '&': 'and'}),
+    str.maketrans({' ': None, '&': 'and'}),
+    str.maketrans({' ': '-', '.': None}),
+    str.maketrans({' ': None, '.': None}),
+]
+
+# Everything except alphanumerics, spaces and hyphens (\w minus underscore
+# matches exactly the str.isalnum() characters)
+_SLUG_STRIP_PATTERN = re.compile(r'[^\w -]|_')
+
+
 def generate_slugs(company_name: str, aliases: list[str] | None = None) -> list[str]:
     """
     Generate possible ATS slug variations for a company name.
@@ -131,12 +177,8 @@ def generate_slugs(company_name: str, aliases: list[str] | None = None) -> list[
         clean = name.lower()
 
         # Basic variations
-        slugs.add(clean.replace(' ', '-'))
-        slugs.add(clean.replace(' ', ''))
-        slugs.add(clean.replace(' ', '-').replace('&', 'and'))
-        slugs.add(clean.replace(' ', '').replace('&', 'and'))
-        slugs.add(clean.replace(' ', '-').replace('.', ''))
-        slugs.add(clean.replace('.', '').replace(' ', ''))
+        for table in _SLUG_TRANSLATIONS:
+            slugs.add(clean.translate(table))
 
         # Remove common suffixes
         for suffix in [' ai', ' inc', ' labs', ' health', ' robotics']:
@@ -146,7 +188,7 @@ def generate_slugs(company_name: str, aliases: list[str] | None = None) -> list[
                 slugs.add(base.replace(' ', ''))
 
         # Handle special characters
-        slug_clean = ''.join(c for c in clean if c.isalnum() or c in ' -')
+        slug_clean = _SLUG_STRIP_PATTERN.sub('', clean)
         slugs.add(slug_clean.replace(' ', '-'))
         slugs.add(slug_clean.replace(' ', ''))
 
@@ -158,7 +200,7 @@ def _probe_ashby(slug: str, timeout: int = 5) -> Optional[dict]:
     """Check if company exists on Ashby with jobs."""
     try:
         url = f"https://api.ashbyhq.com/posting-api/job-board/{slug}"
-        response = requests.get(url, params={'includeCompensation': 'true'}, timeout=timeout)
+        response = session.get(url, params={'includeCompensation': 'true'}, timeout=timeout)
         if response.status_code == 200:
             data = response.json()
             job_count = len(data.get('jobs', []))
@@ -173,7 +215,7 @@ def _probe_greenhouse(slug: str, timeout: int = 5) -> Optional[dict]:
     """Check if company exists on Greenhouse with jobs."""
     try:
         url = f"https://boards-api.greenhouse.io/v1/boards/{slug}/jobs"
-        response = requests.get(url, timeout=timeout)
+        response = session.get(url, timeout=timeout)
         if response.status_code == 200:
             data = response.json()
             job_count = len(data.get('jobs', []))
@@ -188,7 +230,7 @@ def _probe_lever(slug: str, timeout: int = 5) -> Optional[dict]:
     """Check if company exists on Lever with jobs."""
     try:
         url = f"https://api.lever.co/v0/postings/{slug}"
-        response = requests.get(url, params={'mode': 'json'}, timeout=timeout)
+        response = session.get(url, params={'mode': 'json'}, timeout=timeout)
         if response.status_code == 200:
             data = response.json()
             job_count = len(data) if isinstance(data, list) else 0
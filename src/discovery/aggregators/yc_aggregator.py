@@ -13,10 +13,10 @@ Note: yc-oss only provides company names and websites, no job URLs.
 We probe ATS APIs to discover which platforms companies use.
 """
 
-import requests
+import orjson
 
 from .types import CompanyLead, AggregatorResult
-from .utils import probe_companies_parallel, SUPPORTED_ATS
+from .utils import probe_companies_parallel, SUPPORTED_ATS, session
 
 
 YC_OSS_API_URL = "https://yc-oss.github.io/api/companies/all.json"
@@ -47,9 +47,9 @@ class YCAggregator:
         """
         print("Fetching YC companies from yc-oss API...")
         print(f"  URL: {YC_OSS_API_URL}")
-        response = requests.get(YC_OSS_API_URL, timeout=30)
+        response = session.get(YC_OSS_API_URL, timeout=30)
         response.raise_for_status()
-        raw_data = response.json()
+        raw_data = orjson.loads(response.content)
         print(f"  ✓ Downloaded {len(raw_data):,} companies")
 
         # Extract company names and websites
@@ -59,6 +59,10 @@ class YCAggregator:
             if name:
                 company_data[name] = (item.get('website') or '').strip() or None
 
+        # Only name/website are kept; release the full payload (descriptions,
+        # founders, tags...) before the long ATS probing phase
+        del raw_data, response
+
         company_names = list(company_data.keys())
 
         # Determine probing limit
@@ -22,12 +22,16 @@ Setup required:
 """
 
 import sys
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 import re
 import os
+import threading
 from pathlib import Path
 from urllib.parse import urlparse
-from time import sleep
+from time import sleep, monotonic
+from concurrent.futures import ThreadPoolExecutor
 from tabulate import tabulate
 from dotenv import load_dotenv
 
@@ -36,7 +40,7 @@ src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 
-from utils.jobs_db_conn import get_connection, is_remote
+from utils.jobs_db_conn import get_connection, shared_connection, is_remote
 from utils.constants import (
     SIZE_SMALL, SIZE_MEDIUM, SIZE_LARGE,
     USE_LINKEDIN_FOR_COMPANY_SIZE,
@@ -56,6 +60,43 @@ GOOGLE_API_KEY = os.environ.get("GOOGLE_API_KEY")
 GOOGLE_CSE_ID = os.environ.get("GOOGLE_CSE_ID")
 GOOGLE_SEARCH_URL = "https://www.googleapis.com/customsearch/v1"
 
+# Companies are discovered in parallel; Google searches and LinkedIn page
+# fetches stay globally paced
+DISCOVERY_WORKERS = 5
+GOOGLE_MIN_INTERVAL = 0.5  # seconds between Custom Search requests (all threads)
+LINKEDIN_MIN_INTERVAL = 1.0  # seconds between LinkedIn page fetches (all threads)
+
+# Shared session so Google and LinkedIn requests reuse pooled keep-alive
+# connections across companies and worker threads. No retries: website
+# probes expect failures and would multiply their timeouts.
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=DISCOVERY_WORKERS * 2,
+    pool_maxsize=DISCOVERY_WORKERS * 2,
+))
+
+
+class _RequestPacer:
+    """Keeps requests to one service at least min_interval apart across threads."""
+
+    def __init__(self, min_interval):
+        self._min_interval = min_interval
+        self._lock = threading.Lock()
+        self._next_at = 0.0
+
+    def wait(self):
+        """Block until the next request may be sent."""
+        with self._lock:
+            now = monotonic()
+            wait = self._next_at - now
+            self._next_at = max(now, self._next_at) + self._min_interval
+        if wait > 0:
+            sleep(wait)
+
+
+_google_pacer = _RequestPacer(GOOGLE_MIN_INTERVAL)
+_linkedin_pacer = _RequestPacer(LINKEDIN_MIN_INTERVAL)
+
 
 def search_linkedin_company_url(company_name):
     """
@@ -76,13 +117,14 @@ def search_linkedin_company_url(company_name):
             'num': 3
         }
 
-        response = requests.get(GOOGLE_SEARCH_URL, params=params, timeout=10)
+        _google_pacer.wait()
+        response = _session.get(GOOGLE_SEARCH_URL, params=params, timeout=10)
 
         if response.status_code != 200:
             print(f"    ✗ Google API error: {response.status_code}")
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
         items = data.get('items', [])
 
         # Return first LinkedIn company page URL
@@ -115,7 +157,8 @@ def fetch_linkedin_employee_count(linkedin_url):
         headers = {
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         }
-        response = requests.get(linkedin_url, headers=headers, timeout=15)
+        _linkedin_pacer.wait()
+        response = _session.get(linkedin_url, headers=headers, timeout=15)
 
         if response.status_code != 200:
             print(f"    ✗ LinkedIn page fetch error: {response.status_code}")
@@ -321,8 +364,13 @@ def mark_company_contacts_searched(company_id):
 
 
 def get_companies_with_pending_jobs(limit=None):
-    """Get companies that have pending jobs and haven't been searched for contacts yet."""
-    with get_connection() as conn:
+    """
+    Get companies that have pending jobs and haven't been searched for contacts yet.
+
+    Returned as a list: callers size the run up front (progress counts and
+    the search quota estimate), and the result is one row per company.
+    """
+    with get_connection(readonly=True) as conn:
         cursor = conn.cursor()
 
         # Use a subquery with GROUP BY for PostgreSQL compatibility
@@ -342,9 +390,7 @@ def get_companies_with_pending_jobs(limit=None):
             query += f" LIMIT {limit}"
 
         cursor.execute(query)
-        companies = [dict(row) for row in cursor.fetchall()]
-
-        return companies
+        return [dict(row) for row in cursor]
 
 
 def extract_domain_from_ats_url(ats_url):
@@ -367,6 +413,28 @@ def extract_domain_from_ats_url(ats_url):
     return None
 
 
+# Guessed domains worth a HEAD request: a single valid hostname label
+# (letters, digits, inner hyphens, at most 63 chars per DNS) under .com.
+# Names with punctuation can never resolve and would only cost a
+# connection timeout.
+_PLAUSIBLE_DOMAIN_PATTERN = re.compile(r'^[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.com$')
+
+
+def _probe_website(domain):
+    """HEAD https://{domain}; return the URL if it responds without error."""
+    if not domain or not _PLAUSIBLE_DOMAIN_PATTERN.match(domain):
+        return None
+
+    try:
+        response = _session.head(f"https://{domain}", timeout=5, allow_redirects=True)
+        if response.status_code < 400:
+            return f"https://{domain}"
+    except:
+        pass
+
+    return None
+
+
 def try_find_company_website(company_name, ats_url):
     """
     Try to find company website.
@@ -374,27 +442,24 @@ def try_find_company_website(company_name, ats_url):
     Strategy:
     1. Extract from ATS URL (e.g., jobs.ashbyhq.com/openai -> openai.com)
     2. Try common pattern: {company_name}.com
+
+    Guesses that can't be valid hostnames are skipped without a request.
     """
     # Try extracting from ATS URL first
     domain = extract_domain_from_ats_url(ats_url)
     if domain:
-        try:
-            response = requests.head(f"https://{domain}", timeout=5, allow_redirects=True)
-            if response.status_code < 400:
-                return f"https://{domain}"
-        except:
-            pass
+        domain = domain.lower()
+        website = _probe_website(domain)
+        if website:
+            return website
 
     # Try simple pattern: company-name.com
     simple_domain = company_name.lower().replace(' ', '').replace('-', '') + '.com'
-    try:
-        response = requests.head(f"https://{simple_domain}", timeout=5, allow_redirects=True)
-        if response.status_code < 400:
-            return f"https://{simple_domain}"
-    except:
-        pass
+    if simple_domain == domain:
+        # Same host as the ATS slug guess, which already failed
+        return None
 
-    return None
+    return _probe_website(simple_domain)
 
 
 def search_linkedin_profiles(company_name, title_keywords=None):
@@ -426,13 +491,14 @@ def search_linkedin_profiles(company_name, title_keywords=None):
             'num': 10  # Get top 10 results
         }
 
-        response = requests.get(GOOGLE_SEARCH_URL, params=params, timeout=10)
+        _google_pacer.wait()
+        response = _session.get(GOOGLE_SEARCH_URL, params=params, timeout=10)
 
         if response.status_code != 200:
             print(f"    ✗ Google API error: {response.status_code}")
             return []
 
-        data = response.json()
+        data = orjson.loads(response.content)
         items = data.get('items', [])
 
         return items
@@ -466,6 +532,46 @@ def extract_name_from_linkedin_url(url):
     return name
 
 
+# Title extraction patterns, compiled once at import since every search
+# result runs through the same set
+_LINKEDIN_PIPE_PATTERN = re.compile(r'\s*\|\s*LinkedIn')
+_LINKEDIN_DASH_PATTERN = re.compile(r'\s*-\s*LinkedIn')
+
+# Pattern 1: "Name - Title at Company" or "Name - Title | ..."
+_TITLE_DASH_PATTERN = re.compile(
+    r'-\s*([^-|]+?(?:founder|ceo|cto|chief|vp|director|head of|manager|lead|recruiter|recruiting|hiring|engineer)[^-|]*)',
+    re.IGNORECASE
+)
+_TITLE_TRAILING_COMPANY_PATTERN = re.compile(r'\s+(?:at|@|·|•)\s+.*$', re.IGNORECASE)
+
+# Pattern 2: "Title at Company" (standalone)
+_TITLE_AT_PATTERN = re.compile(
+    r'((?:co-?)?(?:founder|ceo|cto|chief\s+\w+\s+officer|vp\s+\w+|director\s+of\s+\w+|head\s+of\s+\w+|'
+    r'engineering\s+manager|technical\s+recruiter|recruiter|recruiting\s+\w+)[^·•|]*?)'
+    r'\s+(?:at|@)\s+',
+    re.IGNORECASE
+)
+
+# Pattern 3: title keywords with context, in priority order
+# e.g., "Co-Founder & CEO", "VP of Engineering", "Head of Recruiting"
+_TITLE_KEYWORD_PATTERNS = [
+    re.compile(pattern, re.IGNORECASE) for pattern in (
+        r'((?:co-?)?founder(?:\s*[&,]\s*(?:ceo|cto))?)',
+        r'(ceo|chief\s+executive\s+officer)',
+        r'(cto|chief\s+technology\s+officer)',
+        r'(chief\s+\w+\s+officer)',
+        r'(vp\s+(?:of\s+)?(?:engineering|product|technology|people))',
+        r'(director\s+of\s+engineering)',
+        r'(head\s+of\s+(?:engineering|product|recruiting|talent|hiring))',
+        r'(engineering\s+manager)',
+        r'((?:technical\s+)?recruiter)',
+        r'(recruiting\s+(?:manager|lead|coordinator))',
+        r'(talent\s+acquisition(?:\s+\w+)?)',
+        r'(hiring\s+(?:manager|lead))',
+    )
+]
+
+
 def extract_title_from_snippet(snippet, title_text=""):
     """
     Extract job title from Google search snippet and title.
@@ -487,62 +593,77 @@ def extract_title_from_snippet(snippet, title_text=""):
     full_text = f"{title_text} {snippet}"
 
     # Clean up LinkedIn noise
-    full_text = re.sub(r'\s*\|\s*LinkedIn', '', full_text)
-    full_text = re.sub(r'\s*-\s*LinkedIn', '', full_text)
+    full_text = _LINKEDIN_PIPE_PATTERN.sub('', full_text)
+    full_text = _LINKEDIN_DASH_PATTERN.sub('', full_text)
     full_text = full_text.replace('View profile', '').replace("'s profile", '')
 
-    # Pattern 1: "Name - Title at Company" or "Name - Title | ..."
-    # The dash before title is common in LinkedIn titles
-    dash_pattern = re.search(
-        r'-\s*([^-|]+?(?:founder|ceo|cto|chief|vp|director|head of|manager|lead|recruiter|recruiting|hiring|engineer)[^-|]*)',
-        full_text,
-        re.IGNORECASE
-    )
+    # Pattern 1: the dash before title is common in LinkedIn titles
+    dash_pattern = _TITLE_DASH_PATTERN.search(full_text)
     if dash_pattern:
         title = dash_pattern.group(1).strip()
         # Clean up trailing "at Company" or "· Company"
-        title = re.sub(r'\s+(?:at|@|·|•)\s+.*$', '', title, flags=re.IGNORECASE)
+        title = _TITLE_TRAILING_COMPANY_PATTERN.sub('', title)
         if title and len(title) < 80:  # Sanity check
             return title.strip()
 
     # Pattern 2: "Title at Company" (standalone)
-    at_pattern = re.search(
-        r'((?:co-?)?(?:founder|ceo|cto|chief\s+\w+\s+officer|vp\s+\w+|director\s+of\s+\w+|head\s+of\s+\w+|'
-        r'engineering\s+manager|technical\s+recruiter|recruiter|recruiting\s+\w+)[^·•|]*?)'
-        r'\s+(?:at|@)\s+',
-        full_text,
-        re.IGNORECASE
-    )
+    at_pattern = _TITLE_AT_PATTERN.search(full_text)
     if at_pattern:
         title = at_pattern.group(1).strip()
         if title and len(title) < 80:
             return title.strip()
 
     # Pattern 3: Look for title keywords with context
-    # e.g., "Co-Founder & CEO", "VP of Engineering", "Head of Recruiting"
-    keyword_patterns = [
-        r'((?:co-?)?founder(?:\s*[&,]\s*(?:ceo|cto))?)',
-        r'(ceo|chief\s+executive\s+officer)',
-        r'(cto|chief\s+technology\s+officer)',
-        r'(chief\s+\w+\s+officer)',
-        r'(vp\s+(?:of\s+)?(?:engineering|product|technology|people))',
-        r'(director\s+of\s+engineering)',
-        r'(head\s+of\s+(?:engineering|product|recruiting|talent|hiring))',
-        r'(engineering\s+manager)',
-        r'((?:technical\s+)?recruiter)',
-        r'(recruiting\s+(?:manager|lead|coordinator))',
-        r'(talent\s+acquisition(?:\s+\w+)?)',
-        r'(hiring\s+(?:manager|lead))',
-    ]
-
-    for pattern in keyword_patterns:
-        match = re.search(pattern, full_text, re.IGNORECASE)
+    for pattern in _TITLE_KEYWORD_PATTERNS:
+        match = pattern.search(full_text)
         if match:
             return match.group(1).strip()
 
     return "Unknown"
 
 
+# Compiled per-company matchers, keyed by company name. Each company is
+# validated against up to ~30 search results, so compile its patterns once.
+_VALIDATOR_CACHE = {}
+
+_COMPANY_SUFFIX_PATTERN = re.compile(r'\s*(inc\.?|llc|corp\.?|co\.?|ltd\.?)\s*$', re.IGNORECASE)
+_EXTENDED_NAME_WORDS = (
+    r'therapeutics|health|bio|medical|capital|partners|group|holdings|technologies|'
+    r'solutions|labs|ai|software|systems|energy|cloud'
+)
+
+
+def _compile_company_validator(company_name):
+    """
+    Build (and cache) the precompiled patterns used to validate a company match.
+
+    The company name is fixed for every result of a search, so the escaping and
+    regex compilation happen once per company instead of once per candidate.
+    """
+    validator = _VALIDATOR_CACHE.get(company_name)
+    if validator is not None:
+        return validator
+
+    # Normalize company name (remove common suffixes for matching)
+    normalized = _COMPANY_SUFFIX_PATTERN.sub('', company_name.lower())
+    escaped = re.escape(normalized)
+
+    validator = {
+        'normalized': normalized,
+        # Pattern: "at Company" or "@ Company" or "· Company" or "• Company"
+        'exact': re.compile(rf'\bat\s+{escaped}\b|@\s*{escaped}\b|[·•]\s*{escaped}\b', re.IGNORECASE),
+        'strict_at': re.compile(rf'\bat\s+{escaped}\b', re.IGNORECASE),
+        'word_boundary': re.compile(rf'\b{escaped}\b', re.IGNORECASE),
+        'extended': re.compile(rf'\b{escaped}\s+(?:{_EXTENDED_NAME_WORDS})', re.IGNORECASE),
+        'short_strict': re.compile(
+            rf'\bat\s+{escaped}(?:\s|$|[,.])|working\s+(?:at|for)\s+{escaped}',
+            re.IGNORECASE
+        ),
+    }
+    _VALIDATOR_CACHE[company_name] = validator
+    return validator
+
+
 def validate_company_match(snippet, title_text, company_name, person_name=None):
     """
     Validate that a search result actually belongs to the target company.
@@ -562,10 +683,8 @@ def validate_company_match(snippet, title_text, company_name, person_name=None):
         confidence: 'high' (exact match), 'medium' (likely match), 'low' (possible match)
     """
     full_text = f"{title_text} {snippet}".lower()
-    company_lower = company_name.lower()
-
-    # Normalize company name (remove common suffixes for matching)
-    company_normalized = re.sub(r'\s*(inc\.?|llc|corp\.?|co\.?|ltd\.?)\s*$', '', company_lower, flags=re.IGNORECASE)
+    validator = _compile_company_validator(company_name)
+    company_normalized = validator['normalized']
 
     # If the company name appears in the person's name, this is likely a false positive
     # e.g., searching for "Anon" company but finding "Auston Anon" (person's last name)
@@ -574,48 +693,28 @@ def validate_company_match(snippet, title_text, company_name, person_name=None):
         if company_normalized in person_name_lower:
             # Company name is in the person's name - need stronger evidence
             # Must have explicit "at Company" pattern to be valid
-            strict_at_pattern = rf'\bat\s+{re.escape(company_normalized)}\b'
-            if re.search(strict_at_pattern, full_text, re.IGNORECASE):
+            if validator['strict_at'].search(full_text):
                 return (True, 'medium')
             return (False, 'low')
 
     # Check for exact company name match with word boundaries
-    # Pattern: "at Company" or "@ Company" or "· Company" or "• Company"
-    exact_patterns = [
-        rf'\bat\s+{re.escape(company_normalized)}\b',
-        rf'@\s*{re.escape(company_normalized)}\b',
-        rf'[·•]\s*{re.escape(company_normalized)}\b',
-    ]
-
-    for pattern in exact_patterns:
-        if re.search(pattern, full_text, re.IGNORECASE):
-            return (True, 'high')
+    if validator['exact'].search(full_text):
+        return (True, 'high')
 
     # Check for company name appearing as a word (not part of another company)
     # Avoid "Finch" matching "Finch Therapeutics" by checking word boundaries
     if len(company_normalized) >= 4:  # Only for reasonably long names
-        word_boundary = rf'\b{re.escape(company_normalized)}\b'
-        if re.search(word_boundary, full_text, re.IGNORECASE):
+        if validator['word_boundary'].search(full_text):
             # Check it's not part of a longer company name
             # e.g., "Finch Therapeutics" should not match "Finch"
-            extended_match = re.search(
-                rf'\b{re.escape(company_normalized)}\s+(?:therapeutics|health|bio|medical|capital|partners|group|holdings|technologies|solutions|labs|ai|software|systems|energy|cloud)',
-                full_text,
-                re.IGNORECASE
-            )
-            if not extended_match:
+            if not validator['extended'].search(full_text):
                 return (True, 'medium')
 
     # For very short names (< 4 chars), require more context
     if len(company_normalized) < 4:
         # Must have "at X" or similar direct association
-        strict_patterns = [
-            rf'\bat\s+{re.escape(company_normalized)}(?:\s|$|[,.])',
-            rf'working\s+(?:at|for)\s+{re.escape(company_normalized)}',
-        ]
-        for pattern in strict_patterns:
-            if re.search(pattern, full_text, re.IGNORECASE):
-                return (True, 'medium')
+        if validator['short_strict'].search(full_text):
+            return (True, 'medium')
         return (False, 'low')
 
     # If company name appears but without clear context, low confidence
@@ -625,6 +724,11 @@ def validate_company_match(snippet, title_text, company_name, person_name=None):
     return (False, 'low')
 
 
+# All priority keywords as one alternation, so a title is scanned once
+# instead of once per keyword
+_PRIORITY_ROLE_PATTERN = re.compile('|'.join(re.escape(k) for k in PRIORITY_ROLE_KEYWORDS))
+
+
 def is_priority_role(title):
     """
     Determine if this is a priority contact.
@@ -632,8 +736,7 @@ def is_priority_role(title):
     Uses PRIORITY_ROLE_KEYWORDS from constants.py.
     Priority roles include decision makers, engineering leadership, and recruiters.
     """
-    title_lower = title.lower()
-    return any(keyword in title_lower for keyword in PRIORITY_ROLE_KEYWORDS)
+    return _PRIORITY_ROLE_PATTERN.search(title.lower()) is not None
 
 
 def discover_people_via_google(company_name, company_id=None, use_linkedin_for_size=None):
@@ -653,7 +756,20 @@ def discover_people_via_google(company_name, company_id=None, use_linkedin_for_s
 
     Returns list of {name, title, linkedin_url, is_priority}.
     """
+    people, _size = _discover_people_with_size(company_name, company_id, use_linkedin_for_size)
+    return people
+
+
+def _discover_people_with_size(company_name, company_id=None, use_linkedin_for_size=None):
+    """
+    discover_people_via_google, also returning the size it determined.
+
+    Returns:
+        Tuple of (people, (size_category, count, source)); count and source
+        are None when no company_id was given.
+    """
     people = []
+    count, size_source = None, None
 
     # Determine company size and targeting strategy
     if company_id:
@@ -717,13 +833,10 @@ def discover_people_via_google(company_name, company_id=None, use_linkedin_for_s
                     'match_confidence': confidence
                 })
 
-        # Be respectful with API rate limits
-        sleep(0.5)
-
     # Sort by priority (decision makers first)
     people.sort(key=lambda p: (not p['is_priority'], p['name']))
 
-    return people
+    return people, (size_category, count, size_source)
 
 
 def store_website(company_id, website):
@@ -741,22 +854,91 @@ def store_website(company_id, website):
         conn.commit()
 
 
-def store_contact(company_id, name, title, linkedin_url, is_priority, match_confidence='medium'):
+def _insert_contacts(cursor, company_id, people):
     """
-    Store contact in database.
+    Insert contacts for one company on an open cursor (no commit).
+
+    Names already stored for the company are looked up once up front so the
+    remaining rows can be inserted with a single executemany.
+
+    Returns:
+        Set of names that were newly inserted
+    """
+    p = _placeholder()
+    from datetime import datetime, timezone
+    now = datetime.now(timezone.utc).isoformat()
+
+    cursor.execute(f"SELECT name FROM contacts WHERE company_id = {p}", (company_id,))
+    existing = {row['name'] for row in cursor.fetchall()}
+
+    rows = []
+    new_names = set()
+    for person in people:
+        if person['name'] in existing or person['name'] in new_names:
+            continue
+        new_names.add(person['name'])
+        rows.append((
+            company_id,
+            person['name'],
+            person['title'],
+            person['linkedin_url'],
+            person['is_priority'],
+            person.get('match_confidence', 'medium'),
+            now
+        ))
+
+    if not rows:
+        return set()
+
+    if is_remote():
+        cursor.executemany(f"""
+            INSERT INTO contacts (company_id, name, title, linkedin_url, is_priority, match_confidence, discovered_date)
+            VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
+            ON CONFLICT (company_id, name) DO NOTHING
+        """, rows)
+    else:
+        cursor.executemany(f"""
+            INSERT OR IGNORE INTO contacts (company_id, name, title, linkedin_url, is_priority, match_confidence, discovered_date)
+            VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
+        """, rows)
+
+    return new_names
+
+
+def store_contacts_bulk(company_id, people):
+    """
+    Store several contacts for one company in a single transaction.
 
     Uses INSERT OR IGNORE to avoid duplicates (based on company_id + name).
 
     Args:
         company_id: Database ID of the company
-        name: Contact's full name
-        title: Job title
-        linkedin_url: LinkedIn profile URL
-        is_priority: True if this is a priority contact (decision maker, etc.)
-        match_confidence: 'high' or 'medium' - how confident we are they work at this company
+        people: List of person dicts with name, title, linkedin_url,
+                is_priority and optional match_confidence ('medium' default)
 
     Returns:
-        True if inserted, False if already existed
+        Set of names that were newly inserted
+    """
+    if not people:
+        return set()
+
+    with get_connection() as conn:
+        cursor = conn.cursor()
+        new_names = _insert_contacts(cursor, company_id, people)
+        conn.commit()
+
+        return new_names
+
+
+def store_company_discovery(company_id, website, people):
+    """
+    Store everything discovered for a company in one transaction.
+
+    Writes the website (if found), the given contacts, and the
+    contacts_searched_at marker with a single commit.
+
+    Returns:
+        Set of contact names that were newly inserted
     """
     p = _placeholder()
     from datetime import datetime, timezone
@@ -765,22 +947,48 @@ def store_contact(company_id, name, title, linkedin_url, is_priority, match_conf
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        if is_remote():
+        if website:
             cursor.execute(f"""
-                INSERT INTO contacts (company_id, name, title, linkedin_url, is_priority, match_confidence, discovered_date)
-                VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
-                ON CONFLICT (company_id, name) DO NOTHING
-            """, (company_id, name, title, linkedin_url, is_priority, match_confidence, now))
+                UPDATE companies
+                SET website = {p}, contacts_searched_at = {p}
+                WHERE id = {p}
+            """, (website, now, company_id))
         else:
             cursor.execute(f"""
-                INSERT OR IGNORE INTO contacts (company_id, name, title, linkedin_url, is_priority, match_confidence, discovered_date)
-                VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
-            """, (company_id, name, title, linkedin_url, is_priority, match_confidence, now))
+                UPDATE companies SET contacts_searched_at = {p} WHERE id = {p}
+            """, (now, company_id))
 
-        rows_affected = cursor.rowcount
+        new_names = _insert_contacts(cursor, company_id, people) if people else set()
         conn.commit()
 
-        return rows_affected > 0  # True if inserted, False if already existed
+        return new_names
+
+
+def store_contact(company_id, name, title, linkedin_url, is_priority, match_confidence='medium'):
+    """
+    Store contact in database.
+
+    Uses INSERT OR IGNORE to avoid duplicates (based on company_id + name).
+
+    Args:
+        company_id: Database ID of the company
+        name: Contact's full name
+        title: Job title
+        linkedin_url: LinkedIn profile URL
+        is_priority: True if this is a priority contact (decision maker, etc.)
+        match_confidence: 'high' or 'medium' - how confident we are they work at this company
+
+    Returns:
+        True if inserted, False if already existed
+    """
+    new_names = store_contacts_bulk(company_id, [{
+        'name': name,
+        'title': title,
+        'linkedin_url': linkedin_url,
+        'is_priority': is_priority,
+        'match_confidence': match_confidence
+    }])
+    return name in new_names
 
 
 def discover_contacts_for_companies(companies, use_linkedin_for_size=None):
@@ -800,88 +1008,150 @@ def discover_contacts_for_companies(companies, use_linkedin_for_size=None):
 
     Returns list of dicts with discovery results.
     """
+    # Each worker buffers its company's output so logs stay grouped, and
+    # results are emitted in input order. Website lookups run on their own
+    # pool so they overlap the (rate-limited) LinkedIn searches.
+    output = _ThreadBufferedOutput(sys.stdout)
+    total = len(companies)
+
+    def process_one(index, company):
+        output.start_buffer()
+        try:
+            print(f"\n[{index}/{total}] {company['name']}")
+            # One DB connection per company for all its lookups and writes
+            with shared_connection():
+                result = _discover_company(website_executor, company, use_linkedin_for_size)
+        finally:
+            text = output.end_buffer()
+        return result, text
+
     results = []
+    old_stdout = sys.stdout
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as website_executor, \
+                ThreadPoolExecutor(max_workers=DISCOVERY_WORKERS) as executor:
+            futures = [
+                executor.submit(process_one, i, company)
+                for i, company in enumerate(companies, 1)
+            ]
+            for future in futures:
+                result, text = future.result()
+                output.emit(text)
+                results.append(result)
+    finally:
+        sys.stdout = old_stdout
 
-    for i, company in enumerate(companies, 1):
-        print(f"\n[{i}/{len(companies)}] {company['name']}")
-
-        result = {
-            'company_id': company['id'],
-            'company_name': company['name'],
-            'website': None,
-            'size_category': None,
-            'size_count': None,
-            'size_source': None,
-            'people': [],
-            'new_contacts': 0
-        }
+    return results
 
-        # Find website
-        print("  Finding website...")
-        website = try_find_company_website(company['name'], company['ats_url'])
 
-        if website:
-            result['website'] = website
-            store_website(company['id'], website)
-            print(f"    ✓ Found: {website}")
-        else:
-            print("    ✗ Could not find website")
-
-        # Discover people via Google search for LinkedIn profiles
-        # This also determines company size using configured method
-        people = discover_people_via_google(
-            company['name'],
-            company_id=company['id'],
-            use_linkedin_for_size=use_linkedin_for_size
-        )
+class _ThreadBufferedOutput:
+    """sys.stdout proxy that buffers prints from worker threads.
 
-        # Get the size info that was determined
-        size_category, count, source = get_company_size(
-            company['id'], company['name'], use_linkedin=False  # Don't re-lookup
-        )
-        result['size_category'] = size_category
-        result['size_count'] = count
-        result['size_source'] = source
-        result['people'] = people
-
-        # Store only priority contacts in database
-        if people:
-            priority_people = [p for p in people if p['is_priority']]
-            print(f"  ✓ Found {len(people)} contacts ({len(priority_people)} priority):")
-
-            for person in people:
-                priority_marker = " ⭐" if person['is_priority'] else ""
-
-                # Only store priority contacts
-                if person['is_priority']:
-                    is_new = store_contact(
-                        company['id'],
-                        person['name'],
-                        person['title'],
-                        person['linkedin_url'],
-                        person['is_priority'],
-                        person.get('match_confidence', 'medium')
-                    )
-                    if is_new:
-                        result['new_contacts'] += 1
-                    status = "new" if is_new else "exists"
-                    print(f"    - {person['name']} ({person['title']}){priority_marker} [{status}]")
-                else:
-                    print(f"    - {person['name']} ({person['title']}) [skipped]")
-
-            print(f"  → Stored {result['new_contacts']} new priority contacts")
-        else:
-            print("    ✗ No people found")
+    Between start_buffer() and end_buffer() a thread's writes are collected
+    instead of written; other threads write straight through.
+    """
 
-        # Mark that we've searched this company (even if no contacts found)
-        mark_company_contacts_searched(company['id'])
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def start_buffer(self):
+        self._local.buffer = []
+
+    def end_buffer(self):
+        """Stop buffering this thread and return what it printed."""
+        text = ''.join(self._local.buffer)
+        self._local.buffer = None
+        return text
+
+    def emit(self, text):
+        """Write a finished block to the underlying stream."""
+        if text:
+            self._stream.write(text)
+            self._stream.flush()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        if buffer is None:
+            return self._stream.write(text)
+        buffer.append(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self._local, 'buffer', None) is None:
+            self._stream.flush()
+
+
+def _discover_company(executor, company, use_linkedin_for_size=None):
+    """Discover website, size and contacts for a single company."""
+    result = {
+        'company_id': company['id'],
+        'company_name': company['name'],
+        'website': None,
+        'size_category': None,
+        'size_count': None,
+        'size_source': None,
+        'people': [],
+        'new_contacts': 0
+    }
 
-        results.append(result)
+    website_future = executor.submit(try_find_company_website, company['name'], company['ats_url'])
 
-        # Be respectful with requests
-        sleep(1)
+    # Discover people via Google search for LinkedIn profiles
+    # This also determines company size using configured method
+    people, (size_category, count, source) = _discover_people_with_size(
+        company['name'],
+        company_id=company['id'],
+        use_linkedin_for_size=use_linkedin_for_size
+    )
 
-    return results
+    website = website_future.result()
+
+    result['website'] = website
+    result['size_category'] = size_category
+    result['size_count'] = count
+    result['size_source'] = source
+    result['people'] = people
+
+    # Store website, priority contacts and the searched marker together
+    # (marked even if no contacts found)
+    priority_people = [p for p in people if p['is_priority']]
+    new_names = store_company_discovery(company['id'], website, priority_people)
+    result['new_contacts'] = len(new_names)
+
+    print("  Finding website...")
+    if website:
+        print(f"    ✓ Found: {website}")
+    else:
+        print("    ✗ Could not find website")
+
+    if people:
+        print(f"  ✓ Found {len(people)} contacts ({len(priority_people)} priority):")
+
+        for person in people:
+            priority_marker = " ⭐" if person['is_priority'] else ""
+
+            # Only priority contacts are stored
+            if person['is_priority']:
+                status = "new" if person['name'] in new_names else "exists"
+                print(f"    - {person['name']} ({person['title']}){priority_marker} [{status}]")
+            else:
+                print(f"    - {person['name']} ({person['title']}) [skipped]")
+
+        print(f"  → Stored {result['new_contacts']} new priority contacts")
+    else:
+        print("    ✗ No people found")
+
+    return result
+
+
+# Short contact-target label per size category (summary table)
+SIZE_TARGET_LABELS = {
+    SIZE_SMALL: "CTO",
+    SIZE_MEDIUM: "Eng Lead",
+    SIZE_LARGE: "Recruiter"
+}
 
 
 def main():
@@ -969,10 +1239,14 @@ def main():
     print("SUMMARY")
     print("=" * 80)
 
-    websites_found = sum(1 for r in results if r['website'])
-    people_found = sum(1 for r in results if r['people'])
-    total_people = sum(len(r['people']) for r in results)
-    total_new_contacts = sum(r['new_contacts'] for r in results)
+    websites_found = people_found = total_people = total_new_contacts = 0
+    for r in results:
+        if r['website']:
+            websites_found += 1
+        if r['people']:
+            people_found += 1
+            total_people += len(r['people'])
+        total_new_contacts += r['new_contacts']
 
     print(f"\nCompanies processed: {len(results)}")
     print(f"  Websites found: {websites_found}/{len(results)} ({websites_found/len(results)*100:.0f}%)")
@@ -1000,13 +1274,7 @@ def main():
             count_str = str(size_count) if size_count else '?'
             source_str = size_source[:8] if size_source else ''
 
-            # Target based on size category
-            target_map = {
-                SIZE_SMALL: "CTO",
-                SIZE_MEDIUM: "Eng Lead",
-                SIZE_LARGE: "Recruiter"
-            }
-            target_str = target_map.get(size_category, "?")
+            target_str = SIZE_TARGET_LABELS.get(size_category, "?")
 
             contacts_str = f"{r['new_contacts']} new / {len(r['people'])} total"
             rows.append([r['company_name'][:20], size_category[:6], count_str, source_str, target_str, contacts_str])
@@ -12,15 +12,20 @@ Usage:
 """
 
 import argparse
+import gzip
 import os
 import sys
-import json
+import orjson
 import requests
-import re
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import queue
+import threading
 # Note: sqlite3 removed - using db.get_connection() instead
 from datetime import datetime
 from pathlib import Path
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+from concurrent.futures import ThreadPoolExecutor
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -29,7 +34,7 @@ load_dotenv()
 src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
-from utils.jobs_db_conn import get_connection, is_remote
+from utils.jobs_db_conn import get_connection, shared_connection, is_remote
 
 
 def _placeholder():
@@ -41,17 +46,17 @@ def _placeholder():
 ATS_PLATFORMS = {
     'ashbyhq': {
         'search_query': 'site:jobs.ashbyhq.com',
-        'url_pattern': r'jobs\.ashbyhq\.com/([^/\?#]+)',
+        'host': 'jobs.ashbyhq.com',
         'base_url': 'https://jobs.ashbyhq.com/'
     },
     'lever': {
         'search_query': 'site:jobs.lever.co',
-        'url_pattern': r'jobs\.lever\.co/([^/\?#]+)',
+        'host': 'jobs.lever.co',
         'base_url': 'https://jobs.lever.co/'
     },
     'greenhouse': {
         'search_query': 'site:boards.greenhouse.io',
-        'url_pattern': r'boards\.greenhouse\.io/([^/\?#]+)',
+        'host': 'boards.greenhouse.io',
         'base_url': 'https://boards.greenhouse.io/'
     }
 }
@@ -68,6 +73,18 @@ GOOGLE_CSE_ID = os.getenv('GOOGLE_CSE_ID')
 # Parallelization settings
 PAGES_PER_BATCH = 5  # Fetch 5 pages in parallel
 
+# Shared session so parallel page fetches reuse pooled TLS connections to
+# googleapis.com; retries cover dropped connections only, not HTTP errors
+_session = requests.Session()
+_session.mount('https://', HTTPAdapter(
+    pool_connections=PAGES_PER_BATCH,
+    pool_maxsize=PAGES_PER_BATCH,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=None),
+))
+
+# Rows per multi-row INSERT (5 params each, stays under SQLite's 999-variable limit)
+INSERT_CHUNK_SIZE = 100
+
 
 def check_credentials():
     """Check that Google API credentials are set."""
@@ -90,7 +107,7 @@ def fetch_single_page(query: str, page: int) -> dict:
     start_index = (page - 1) * 10 + 1
 
     try:
-        response = requests.get(
+        response = _session.get(
             'https://www.googleapis.com/customsearch/v1',
             params={
                 'key': GOOGLE_API_KEY,
@@ -103,7 +120,7 @@ def fetch_single_page(query: str, page: int) -> dict:
         )
 
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
 
         items = data.get('items', [])
         return {
@@ -113,7 +130,7 @@ def fetch_single_page(query: str, page: int) -> dict:
             'count': len(items)
         }
 
-    except requests.exceptions.RequestException as e:
+    except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
         return {
             'success': False,
             'page': page,
@@ -133,21 +150,9 @@ def fetch_pages_parallel(query: str, pages: list[int]) -> list[dict]:
     Returns:
         List of results (success or failure for each page)
     """
-    results = []
-
+    # map() yields results in page order, so no sorting is needed
     with ThreadPoolExecutor(max_workers=PAGES_PER_BATCH) as executor:
-        futures = {
-            executor.submit(fetch_single_page, query, page): page
-            for page in pages
-        }
-
-        for future in as_completed(futures):
-            result = future.result()
-            results.append(result)
-
-    # Sort by page number for consistent ordering
-    results.sort(key=lambda x: x['page'])
-    return results
+        return list(executor.map(lambda page: fetch_single_page(query, page), pages))
 
 
 def extract_company_slug(url: str, ats_platform: str) -> str | None:
@@ -159,26 +164,38 @@ def extract_company_slug(url: str, ats_platform: str) -> str | None:
         https://jobs.lever.co/figma/abc123 -> figma
         https://jobs.ashbyhq.com/openai -> openai
     """
-    pattern = ATS_PLATFORMS[ats_platform]['url_pattern']
-    match = re.search(pattern, url)
-    if match:
-        return match.group(1)
-    return None
-
-
-def process_search_results(ats_platform: str, all_results: list[dict]) -> list[dict]:
+    # The slug is the first path segment on the platform's host; subdomains
+    # like job-boards.greenhouse.io count as the same host
+    parts = urlsplit(url)
+    if not parts.netloc.lower().endswith(ATS_PLATFORMS[ats_platform]['host']):
+        return None
+    slug = parts.path.lstrip('/').partition('/')[0]
+    return slug or None
+
+
+def process_search_results(
+    ats_platform: str,
+    all_results: list[dict],
+    slugs_seen: set | None = None
+) -> list[dict]:
     """
     Process raw Google search results and extract unique companies.
 
+    Board URLs are not verified with a request here: they come from Google's
+    index, and dead boards surface (and get skipped) when jobs are loaded.
+
     Args:
         ats_platform: ATS platform name
         all_results: List of page results from parallel fetch
+        slugs_seen: Optional set shared across calls so a slug is only
+                    returned once per run (updated in place)
 
     Returns:
         List of company dicts for database insertion
     """
     companies = []
-    slugs_seen = set()
+    if slugs_seen is None:
+        slugs_seen = set()
     base_url = ATS_PLATFORMS[ats_platform]['base_url']
 
     for page_result in all_results:
@@ -212,10 +229,21 @@ def process_search_results(ats_platform: str, all_results: list[dict]) -> list[d
     return companies
 
 
+def get_existing_company_names() -> set[str]:
+    """Load all company names already in the database."""
+    with get_connection(readonly=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM companies")
+        return {row['name'] for row in cursor.fetchall()}
+
+
 def insert_companies_batch(companies: list[dict]) -> dict:
     """
     Insert a batch of companies into the database.
 
+    Relies on the UNIQUE(name) constraint to skip existing companies, and
+    packs up to INSERT_CHUNK_SIZE rows into each multi-row INSERT statement.
+
     Returns:
         Dict with 'added' and 'skipped' counts
     """
@@ -223,39 +251,78 @@ def insert_companies_batch(companies: list[dict]) -> dict:
         return {'added': 0, 'skipped': 0}
 
     p = _placeholder()
-    stats = {'added': 0, 'skipped': 0}
+    active = 'TRUE' if is_remote() else '1'
+    row_sql = f"({p}, {p}, {p}, {p}, {p}, {active})"
+    added = 0
 
     with get_connection() as conn:
         cursor = conn.cursor()
 
-        for company in companies:
-            # Check if exists
-            cursor.execute(f"SELECT id FROM companies WHERE name = {p}", (company['name'],))
-            if cursor.fetchone():
-                stats['skipped'] += 1
-            else:
-                # discovered_date uses DEFAULT CURRENT_TIMESTAMP from schema
-                cursor.execute(f"""
-                    INSERT INTO companies (name, discovery_source, ats_platform, ats_slug, ats_url, is_active)
-                    VALUES ({p}, {p}, {p}, {p}, {p}, 1)
-                """, (
+        for chunk_start in range(0, len(companies), INSERT_CHUNK_SIZE):
+            chunk = companies[chunk_start:chunk_start + INSERT_CHUNK_SIZE]
+            values_sql = ", ".join([row_sql] * len(chunk))
+            params = []
+            for company in chunk:
+                params.extend((
                     company['name'],
                     company['discovery_source'],
                     company['ats_platform'],
                     company['ats_slug'],
                     company['ats_url'],
                 ))
-                stats['added'] += 1
+
+            # discovered_date uses DEFAULT CURRENT_TIMESTAMP from schema
+            if is_remote():
+                cursor.execute(f"""
+                    INSERT INTO companies (name, discovery_source, ats_platform, ats_slug, ats_url, is_active)
+                    VALUES {values_sql}
+                    ON CONFLICT (name) DO NOTHING
+                """, params)
+            else:
+                cursor.execute(f"""
+                    INSERT OR IGNORE INTO companies (name, discovery_source, ats_platform, ats_slug, ats_url, is_active)
+                    VALUES {values_sql}
+                """, params)
+
+            added += cursor.rowcount
 
         conn.commit()
 
-    return stats
+    return {'added': added, 'skipped': len(companies) - added}
+
+
+def _company_writer(batches: queue.Queue, stats: dict):
+    """
+    Writer thread: drain company batches from the queue into the database.
+
+    Owns one connection for the whole run and runs PRAGMA optimize on it
+    before stopping at the None sentinel. An insert error is recorded in
+    stats['error'] and remaining batches are discarded.
+    """
+    with shared_connection() as conn:
+        while True:
+            companies = batches.get()
+            if companies is None:
+                # Refresh planner stats after bulk inserts (cheap: only
+                # analyzes tables whose stats are stale)
+                if not is_remote() and 'error' not in stats:
+                    conn.execute("PRAGMA optimize")
+                return
+            if 'error' in stats:
+                continue
+            try:
+                batch_stats = insert_companies_batch(companies)
+            except Exception as e:
+                stats['error'] = str(e)
+                continue
+            stats['added'] += batch_stats['added']
+            stats['skipped'] += batch_stats['skipped']
 
 
 def save_raw_results(ats_platform: str, all_results: list[dict]):
-    """Save raw search results to JSON file for backup."""
+    """Save raw search results to a gzipped JSON file for backup."""
     timestamp = datetime.now().strftime('%Y-%m-%d_%H%M%S')
-    filename = OUTPUT_DIR / f'{ats_platform}_raw_{timestamp}.json'
+    filename = OUTPUT_DIR / f'{ats_platform}_raw_{timestamp}.json.gz'
 
     # Flatten items from all pages
     all_items = []
@@ -263,13 +330,14 @@ def save_raw_results(ats_platform: str, all_results: list[dict]):
         if result['success']:
             all_items.extend(result['items'])
 
-    with open(filename, 'w') as f:
-        json.dump({
+    # CSE responses repeat URL prefixes and keys, so they compress ~8-10x
+    with gzip.open(filename, 'wb', compresslevel=3) as f:
+        f.write(orjson.dumps({
             'ats_platform': ats_platform,
             'timestamp': timestamp,
             'total_items': len(all_items),
             'items': all_items
-        }, f, indent=2)
+        }, option=orjson.OPT_INDENT_2))
 
     print(f"  Saved raw results to {filename.name}")
 
@@ -306,54 +374,84 @@ def dork_ats(ats_platform: str, start_page: int = 1, max_pages: int = 10):
     all_results = []
     failed_pages = []
 
-    # Process in batches
-    for batch_start in range(0, len(all_pages), PAGES_PER_BATCH):
-        batch_pages = all_pages[batch_start:batch_start + PAGES_PER_BATCH]
-        batch_num = batch_start // PAGES_PER_BATCH + 1
-        total_batches = (len(all_pages) + PAGES_PER_BATCH - 1) // PAGES_PER_BATCH
-
-        print(f"[Batch {batch_num}/{total_batches}] Fetching pages {batch_pages[0]}-{batch_pages[-1]}...")
-
-        # Fetch pages in parallel
-        results = fetch_pages_parallel(query, batch_pages)
-        total_stats['api_calls'] += len(batch_pages)
-
-        # Check for failures
-        batch_failed = [r['page'] for r in results if not r['success']]
-        if batch_failed:
-            failed_pages.extend(batch_failed)
-            for r in results:
-                if not r['success']:
-                    print(f"  ✗ Page {r['page']} failed: {r['error']}")
-
-        # Count successful results
-        successful = [r for r in results if r['success']]
-        total_items = sum(r['count'] for r in successful)
-
-        if not successful:
-            print(f"  ✗ All pages in batch failed")
-            continue
-
-        print(f"  ✓ Fetched {total_items} results from {len(successful)} pages")
-
-        # Process and extract companies
-        companies = process_search_results(ats_platform, results)
-        print(f"  → {len(companies)} unique companies extracted")
-
-        # Insert to database
-        if companies:
-            stats = insert_companies_batch(companies)
-            total_stats['added'] += stats['added']
-            total_stats['skipped'] += stats['skipped']
-            print(f"  → DB: +{stats['added']} added, {stats['skipped']} already exist")
+    # Slugs seen this run, and names already stored (counted as skipped
+    # without a round-trip to the writer). total_stats['added'/'skipped'] is
+    # the writer thread's until it is joined, so these are counted locally.
+    slugs_seen = set()
+    existing_names = get_existing_company_names()
+    known_skipped = 0
 
-        # Accumulate results for backup
-        all_results.extend(results)
+    # DB inserts run on a writer thread so the next Google fetch isn't
+    # blocked on SQLite
+    batches = queue.Queue()
+    writer = threading.Thread(target=_company_writer, args=(batches, total_stats))
+    writer.start()
 
-        # Check if we got empty results (end of search)
-        if total_items == 0:
-            print(f"\n  No more results. Stopping early.")
-            break
+    # Process in batches. Each batch's result lines are collected and
+    # written in one go once the batch is handled.
+    try:
+        for batch_start in range(0, len(all_pages), PAGES_PER_BATCH):
+            batch_pages = all_pages[batch_start:batch_start + PAGES_PER_BATCH]
+            batch_num = batch_start // PAGES_PER_BATCH + 1
+            total_batches = (len(all_pages) + PAGES_PER_BATCH - 1) // PAGES_PER_BATCH
+
+            print(f"[Batch {batch_num}/{total_batches}] Fetching pages {batch_pages[0]}-{batch_pages[-1]}...", flush=True)
+            log = []
+
+            try:
+                # Fetch pages in parallel
+                results = fetch_pages_parallel(query, batch_pages)
+                total_stats['api_calls'] += len(batch_pages)
+
+                # Check for failures
+                batch_failed = [r['page'] for r in results if not r['success']]
+                if batch_failed:
+                    failed_pages.extend(batch_failed)
+                    for r in results:
+                        if not r['success']:
+                            log.append(f"  ✗ Page {r['page']} failed: {r['error']}")
+
+                # Count successful results
+                successful = [r for r in results if r['success']]
+                total_items = sum(r['count'] for r in successful)
+
+                if not successful:
+                    log.append(f"  ✗ All pages in batch failed")
+                    continue
+
+                log.append(f"  ✓ Fetched {total_items} results from {len(successful)} pages")
+
+                # Process and extract companies
+                companies = process_search_results(ats_platform, results, slugs_seen)
+                log.append(f"  → {len(companies)} unique companies extracted")
+
+                new_companies = [c for c in companies if c['name'] not in existing_names]
+                known_skipped += len(companies) - len(new_companies)
+
+                # Hand off to the writer thread and move on to the next fetch
+                if new_companies:
+                    batches.put(new_companies)
+
+                # Accumulate results for backup
+                all_results.extend(results)
+
+                # Check if we got empty results (end of search)
+                if total_items == 0:
+                    log.append(f"\n  No more results. Stopping early.")
+                    break
+            finally:
+                if log:
+                    sys.stdout.write("\n".join(log) + "\n")
+                    sys.stdout.flush()
+    finally:
+        batches.put(None)
+        writer.join()
+        total_stats['skipped'] += known_skipped
+
+    if 'error' in total_stats:
+        print(f"\n  ✗ Database insert failed: {total_stats['error']}")
+    else:
+        print(f"  → DB: +{total_stats['added']} added, {total_stats['skipped']} already exist")
 
     # Save raw results backup
     if all_results:
@@ -7,18 +7,30 @@ Two-stage filtering approach:
    - ACCEPT: Clear new grad matches (score >= 0.7)
    - REVIEW: Borderline cases that need deeper analysis (score 0.5-0.7)
    - REJECT: Not suitable (score < 0.5)
+   - Decisions are cached in data/filter_cache.db; reposted jobs with the
+     same title, location and description reuse them without an API call
 3. STAGE 2 - Sonnet 4.5 (smart but expensive): Batch REVIEW cases with profile context
    - Uses candidate profile to make final decisions on borderline jobs
    - Batched to minimize API costs
 4. Track intern jobs with is_intern flag (don't reject them)
 5. Prioritize US jobs (priority=1) over non-US (priority=3)
+
+Usage:
+    python src/filters/filter_jobs.py          # concurrent API calls
+    python src/filters/filter_jobs.py --batch  # Message Batches API (50% cheaper, async)
 """
 
-import json
+import argparse
+import hashlib
 import os
 import re
+import sqlite3
+import time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from pathlib import Path
-from anthropic import Anthropic
+from anthropic import Anthropic, APIConnectionError, InternalServerError, RateLimitError
 from dotenv import load_dotenv
 import sys
 # Add src/ to path for imports (works for both direct run and agent import)
@@ -26,7 +38,7 @@ src_path = Path(__file__).parent.parent
 if str(src_path) not in sys.path:
     sys.path.insert(0, str(src_path))
 from utils.constants import STATUS_NOT_RELEVANT, STATUS_PENDING
-from utils.jobs_db_conn import get_connection, is_remote
+from utils.jobs_db_conn import get_connection, shared_connection, is_remote
 
 # Cost tracking (optional)
 try:
@@ -41,6 +53,10 @@ load_dotenv()
 
 PROFILE_PATH = Path(__file__).parent.parent.parent / "profile.json"
 
+# Local cache of Stage 1 decisions keyed by the exact Haiku input, so
+# reposted jobs (same title, location and description excerpt) skip the API
+DECISION_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "filter_cache.db"
+
 
 def _placeholder():
     """Return SQL placeholder for current database."""
@@ -50,27 +66,176 @@ def _placeholder():
 BATCH_SIZE = 50  # Smaller batches for description analysis
 SONNET_BATCH_SIZE = 20  # Smaller batches for expensive Sonnet calls
 
+# Concurrent Claude requests per stage (same limits as the agent's /filter)
+HAIKU_CONCURRENCY = 5
+SONNET_CONCURRENCY = 5
+
+# SDK-level retries (exponential backoff) for rate limits / overloaded errors
+API_MAX_RETRIES = 5
+
+# --batch mode: seconds between Message Batches status checks
+BATCH_POLL_INTERVAL = 30
+
+# --batch mode: attempts per Message Batches call on transient errors, on top
+# of the SDK's own retries (backoff starts at BATCH_POLL_INTERVAL and doubles)
+BATCH_API_ATTEMPTS = 5
+
+HAIKU_MODEL = "claude-haiku-4-5-20251001"
+
+# Rows per fetch when streaming unprocessed jobs from the database
+UNPROCESSED_FETCH_SIZE = 1000
+
+# Keys per IN (...) lookup on SQLite (descriptions, decision cache)
+SQLITE_IN_CHUNK_SIZE = 500
+
 # Regex patterns for pre-filtering (case-insensitive)
 REJECT_PATTERNS = {
-    'seniority': re.compile(r'\b(senior|sr\.?|staff|principal|lead|manager|director|vp|vice president|chief|head of|c-level)\b', re.IGNORECASE),
-    'non_engineering': re.compile(r'\b(sales|marketing|account executive|customer success|support|recruiter|recruiting|talent|operations|program manager|product manager|analyst|business development|designer|content|copywriter|finance|accounting|legal|hr|people|accountant|counsel|attorney)\b', re.IGNORECASE),
-    'non_us': re.compile(r'\b(UK|United Kingdom|London|England|Scotland|Wales|Ireland|Dublin|Germany|Berlin|France|Paris|Spain|Madrid|Italy|Rome|Netherlands|Amsterdam|Switzerland|Zurich|Sweden|Stockholm|Norway|Oslo|Denmark|Copenhagen|Finland|Helsinki|Belgium|Brussels|Austria|Vienna|Portugal|Lisbon|Israel|Tel Aviv|India|Bangalore|Mumbai|China|Beijing|Shanghai|Japan|Tokyo|Singapore|Australia|Sydney|Canada|Toronto|Vancouver|Montreal)\b', re.IGNORECASE),
+    'seniority': re.compile(r'\b(?:senior|sr\.?|staff|principal|lead|manager|director|vp|vice president|chief|head of|c-level)\b', re.IGNORECASE),
+    'non_engineering': re.compile(r'\b(?:sales|marketing|account executive|customer success|support|recruiter|recruiting|talent|operations|program manager|product manager|analyst|business development|designer|content|copywriter|finance|accounting|legal|hr|people|accountant|counsel|attorney)\b', re.IGNORECASE),
+    'non_us': re.compile(r'\b(?:UK|United Kingdom|London|England|Scotland|Wales|Ireland|Dublin|Germany|Berlin|France|Paris|Spain|Madrid|Italy|Rome|Netherlands|Amsterdam|Switzerland|Zurich|Sweden|Stockholm|Norway|Oslo|Denmark|Copenhagen|Finland|Helsinki|Belgium|Brussels|Austria|Vienna|Portugal|Lisbon|Israel|Tel Aviv|India|Bangalore|Mumbai|China|Beijing|Shanghai|Japan|Tokyo|Singapore|Australia|Sydney|Canada|Toronto|Vancouver|Montreal)\b', re.IGNORECASE),
 }
 
 # US location indicators (for positive matching)
 # State abbreviations and full names
-US_STATES = r'\b(AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\b'
-US_CITIES = r'\b(San Francisco|SF|NYC|New York|Boston|Seattle|Austin|Denver|Chicago|Los Angeles|LA|Portland|Miami|Atlanta|Washington|Philadelphia|Phoenix|San Diego|San Jose|Dallas|Houston|Detroit|Minneapolis|Tampa|St\. Louis|Baltimore|Charlotte|Indianapolis|Columbus|Nashville|Memphis|Louisville|Milwaukee|Albuquerque|Tucson|Sacramento|Kansas City|Mesa|Virginia Beach|Omaha|Oakland|Raleigh|Colorado Springs|Long Beach|Virginia Beach|Huntington Beach|Foster City|Redwood City|Mountain View|Palo Alto|Menlo Park|Sunnyvale|Santa Clara|Cupertino|San Mateo|Burlingame|Berkeley|Fremont|Irvine|Pasadena|Glendale|Arlington|Cambridge|Somerville)\b'
+US_STATES = r'\b(?:AL|AK|AZ|AR|CA|CO|CT|DE|FL|GA|HI|ID|IL|IN|IA|KS|KY|LA|ME|MD|MA|MI|MN|MS|MO|MT|NE|NV|NH|NJ|NM|NY|NC|ND|OH|OK|OR|PA|RI|SC|SD|TN|TX|UT|VT|VA|WA|WV|WI|WY)\b'
+US_CITIES = r'\b(?:San Francisco|SF|NYC|New York|Boston|Seattle|Austin|Denver|Chicago|Los Angeles|LA|Portland|Miami|Atlanta|Washington|Philadelphia|Phoenix|San Diego|San Jose|Dallas|Houston|Detroit|Minneapolis|Tampa|St\. Louis|Baltimore|Charlotte|Indianapolis|Columbus|Nashville|Memphis|Louisville|Milwaukee|Albuquerque|Tucson|Sacramento|Kansas City|Mesa|Virginia Beach|Omaha|Oakland|Raleigh|Colorado Springs|Long Beach|Huntington Beach|Foster City|Redwood City|Mountain View|Palo Alto|Menlo Park|Sunnyvale|Santa Clara|Cupertino|San Mateo|Burlingame|Berkeley|Fremont|Irvine|Pasadena|Glendale|Arlington|Cambridge|Somerville)\b'
 US_REMOTE = r'Remote \(US\)|Remote \(USA\)|Remote - US|Remote - USA|Remote US|Remote USA|US Remote|USA Remote'
 # Match "US" with word boundaries, but be careful not to match words like "use"
 US_EXPLICIT = r'\bUS\b|\bUSA\b|United States'
-US_INDICATORS = re.compile(f'({US_STATES}|{US_CITIES}|{US_REMOTE}|{US_EXPLICIT})', re.IGNORECASE)
+# Groups are non-capturing throughout: callers only use the whole match
+US_INDICATORS = re.compile(f'(?:{US_STATES}|{US_CITIES}|{US_REMOTE}|{US_EXPLICIT})', re.IGNORECASE)
 
 # Intern detection pattern
-INTERN_PATTERN = re.compile(r'\b(intern|internship|co-op|coop)\b', re.IGNORECASE)
+INTERN_PATTERN = re.compile(r'\b(?:intern|internship|co-op|coop)\b', re.IGNORECASE)
 
 # New grad qualifiers that indicate combined roles
-NEW_GRAD_QUALIFIERS = re.compile(r'\b(new grad|new graduate|entry level|entry-level|early career|junior|jr\.|associate)\b', re.IGNORECASE)
+NEW_GRAD_QUALIFIERS = re.compile(r'\b(?:new grad|new graduate|entry level|entry-level|early career|junior|jr\.|associate)\b', re.IGNORECASE)
+
+# Title keyword classes fused into one alternation so a single scan over the
+# title finds rejecting keywords (first one wins, category via lastgroup) and
+# the intern / new grad markers used by is_intern_only
+TITLE_PATTERN = re.compile(
+    f"(?P<seniority>{REJECT_PATTERNS['seniority'].pattern})"
+    f"|(?P<non_engineering>{REJECT_PATTERNS['non_engineering'].pattern})"
+    f"|(?P<intern>{INTERN_PATTERN.pattern})"
+    f"|(?P<new_grad>{NEW_GRAD_QUALIFIERS.pattern})",
+    re.IGNORECASE,
+)
+TITLE_REJECT_REASONS = {
+    'seniority': 'Seniority indicator',
+    'non_engineering': 'Non-engineering role',
+}
+
+# Keywords marking the description spans Haiku actually scores on:
+# experience requirements and seniority wording. Each hit is widened by up to
+# EXPERIENCE_CONTEXT_CHARS either side, clamped to its line.
+EXPERIENCE_KEYWORD_PATTERN = re.compile(
+    r'\b(?:\d+\+?\s*(?:-\s*\d+\s*)?years?|experience|requirements?|qualifications?'
+    r'|new grad(?:uate)?s?|entry[- ]level|early career|junior)\b',
+    re.IGNORECASE,
+)
+EXPERIENCE_CONTEXT_CHARS = 160
+MAX_EXPERIENCE_SNIPPETS = 5
+
+
+# Stage 1 rubric, sent as the system prompt; only the job list goes in the
+# per-batch user message. It carries cache_control, but together with the
+# tool definition it is well under Haiku 4.5's 4096-token minimum cacheable
+# prefix, so today the marker is a no-op and every batch pays for it in full.
+HAIKU_SYSTEM_PROMPT = """You are doing STAGE 1 filtering for a CS new grad (0-2 years experience) seeking software engineering roles.
+
+Your job: Make obvious decisions. Send borderline cases to REVIEW for deeper analysis.
+
+SCORING CRITERIA:
+
+ACCEPT (score >= 0.7) - Clear new grad matches:
+1. Explicitly says "New Grad", "Entry Level", "Junior", or "0-2 years experience" (score 0.9-1.0)
+2. Engineering role (SWE, ML, Data, DevOps, Backend, Frontend, Fullstack) with NO experience mentioned (score 0.7-0.8)
+3. Has "Associate Engineer" or similar entry-level titles (score 0.8)
+4. Internships (score 0.7+)
+
+REVIEW (score 0.5-0.7) - Borderline cases needing human-level judgment:
+- Engineering role asking for "1-3 years" - possibly flexible (score 0.6)
+- Engineering role with "3-5 years" - might accept strong candidates (score 0.5)
+- Unclear experience requirements but reasonable tech stack (score 0.5-0.6)
+- Ambiguous titles or descriptions
+
+REJECT (score < 0.5) - Clearly not suitable:
+- Explicitly requires "5+ years" (score 0.1)
+- Contains seniority keywords: "Senior", "Staff", "Principal", "Lead" (score 0.0)
+- Non-engineering role (Sales, Marketing, Product Manager, etc.) (score 0.0)
+- Clearly NOT suitable for new grads
+
+Submit one ACCEPT/REVIEW/REJECT decision per job with the submit_decisions tool."""
+
+
+def _decisions_tool(decisions, properties, description):
+    """Build a submit_decisions tool whose input is a list of per-job decisions.
+
+    Forcing this tool (tool_choice) makes Claude return the decisions as
+    schema-shaped tool input instead of JSON text that has to be parsed.
+    """
+    return {
+        "name": "submit_decisions",
+        "description": description,
+        "input_schema": {
+            "type": "object",
+            "properties": {
+                "decisions": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "job_id": {"type": "integer"},
+                            "decision": {"type": "string", "enum": decisions},
+                            "score": {"type": "number", "minimum": 0, "maximum": 1},
+                            **properties,
+                            "reasoning": {"type": "string", "description": "Brief explanation"},
+                        },
+                        "required": ["job_id", "decision", "score", "reasoning"],
+                    },
+                },
+            },
+            "required": ["decisions"],
+        },
+    }
+
+
+HAIKU_DECISIONS_TOOL = _decisions_tool(
+    ["ACCEPT", "REVIEW", "REJECT"],
+    {
+        "min_years": {"type": ["integer", "null"], "description": "Minimum years of experience required, 0-10"},
+        "max_years": {"type": ["integer", "null"], "description": "Maximum years of experience asked for, 0-10"},
+        "is_engineering": {"type": "boolean"},
+    },
+    "Submit the Stage 1 decision for every job in the batch.",
+)
+SONNET_DECISIONS_TOOL = _decisions_tool(
+    ["ACCEPT", "REJECT"],
+    {},
+    "Submit the final decision for every job in the batch, with reasoning about the candidate fit.",
+)
+
+
+def classify_title(job_title):
+    """
+    Scan a job title once for rejection keywords and intern markers.
+
+    Returns: (reject_reason: str or None, intern_only: bool)
+    - reject_reason describes the first seniority / non-engineering keyword
+    - intern_only as in is_intern_only()
+    """
+    reject_reason = None
+    has_intern = has_new_grad = False
+    for match in TITLE_PATTERN.finditer(job_title):
+        kind = match.lastgroup
+        if kind == 'intern':
+            has_intern = True
+        elif kind == 'new_grad':
+            has_new_grad = True
+        elif reject_reason is None:
+            reject_reason = f"{TITLE_REJECT_REASONS[kind]}: {match.group()}"
+    return reject_reason, has_intern and not has_new_grad
 
 
 def is_intern_only(job_title):
@@ -81,29 +246,135 @@ def is_intern_only(job_title):
     - Title contains "intern/internship" AND
     - Does NOT contain "new grad/entry-level/junior/associate"
     """
-    has_intern = INTERN_PATTERN.search(job_title) is not None
-    has_new_grad = NEW_GRAD_QUALIFIERS.search(job_title) is not None
+    return classify_title(job_title)[1]
 
-    # Intern-only if it has intern keyword but no new grad qualifiers
-    return has_intern and not has_new_grad
 
+def get_unprocessed_job_headers():
+    """Yield jobs that haven't been evaluated yet, without descriptions.
 
-def get_unprocessed_jobs():
-    """Get jobs that haven't been evaluated yet, including descriptions."""
-    with get_connection() as conn:
-        cursor = conn.cursor()
+    The regex pre-filter only needs title and location, so the (multi-KB)
+    description column is left for fetch_descriptions() on the jobs that
+    survive it. Rows are streamed (a named server-side cursor on PostgreSQL;
+    SQLite cursors already step lazily), so memory stays flat and
+    pre-filtering starts on the first row.
+    """
+    with get_connection(readonly=True) as conn:
+        cursor = conn.cursor(name="unprocessed_jobs") if is_remote() else conn.cursor()
+        cursor.arraysize = UNPROCESSED_FETCH_SIZE
+        if is_remote():
+            cursor.itersize = UNPROCESSED_FETCH_SIZE
 
         cursor.execute("""
-            SELECT j.id, j.job_title, j.job_description, j.location, c.name as company_name
+            SELECT j.id, j.job_title, j.location, c.name as company_name
             FROM jobs j
             JOIN companies c ON j.company_id = c.id
             WHERE j.evaluated = 0
             ORDER BY j.id
         """)
 
-        jobs = [dict(row) for row in cursor.fetchall()]
+        for row in cursor:
+            yield dict(row)
 
-        return jobs
+
+def fetch_descriptions(job_ids):
+    """Return {job_id: job_description} for the given job ids."""
+    descriptions = {}
+    with get_connection(readonly=True) as conn:
+        cursor = conn.cursor()
+        if is_remote():
+            cursor.execute(
+                "SELECT id, job_description FROM jobs WHERE id = ANY(%s)",
+                (list(job_ids),)
+            )
+            descriptions.update((row['id'], row['job_description']) for row in cursor)
+        else:
+            # Chunked to stay under SQLite's bound-variable limit
+            for start in range(0, len(job_ids), SQLITE_IN_CHUNK_SIZE):
+                chunk = job_ids[start:start + SQLITE_IN_CHUNK_SIZE]
+                placeholders = ", ".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT id, job_description FROM jobs WHERE id IN ({placeholders})",
+                    chunk
+                )
+                descriptions.update((row['id'], row['job_description']) for row in cursor)
+    return descriptions
+
+
+def _open_decision_cache():
+    """Open the Stage 1 decision cache, creating it on first use."""
+    DECISION_CACHE_PATH.parent.mkdir(exist_ok=True)
+    conn = sqlite3.connect(DECISION_CACHE_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("""
+        CREATE TABLE IF NOT EXISTS decisions (
+            key BLOB PRIMARY KEY,
+            decision TEXT NOT NULL,
+            score REAL,
+            reasoning TEXT,
+            min_years INTEGER,
+            max_years INTEGER,
+            is_engineering INTEGER,
+            created_at INTEGER NOT NULL
+        ) WITHOUT ROWID
+    """)
+    return conn
+
+
+def decision_cache_key(job):
+    """Hash exactly what Stage 1 sends for a job.
+
+    The model, rubric and output schema are hashed in too, so editing
+    HAIKU_SYSTEM_PROMPT / HAIKU_DECISIONS_TOOL or switching models never
+    reuses stale decisions.
+    """
+    payload = orjson.dumps([
+        HAIKU_MODEL,
+        HAIKU_SYSTEM_PROMPT,
+        HAIKU_DECISIONS_TOOL,
+        job["job_title"],
+        job.get("location", ""),
+        _job_excerpt(job),
+    ])
+    return hashlib.blake2b(payload, digest_size=16).digest()
+
+
+def load_cached_decisions(keys):
+    """Return {key: decision row dict} for the cache keys already stored."""
+    cached = {}
+    if not keys:
+        return cached
+    conn = _open_decision_cache()
+    try:
+        # Chunked to stay under SQLite's bound-variable limit
+        for start in range(0, len(keys), SQLITE_IN_CHUNK_SIZE):
+            chunk = keys[start:start + SQLITE_IN_CHUNK_SIZE]
+            placeholders = ", ".join("?" * len(chunk))
+            for row in conn.execute(f"SELECT * FROM decisions WHERE key IN ({placeholders})", chunk):
+                cached[row['key']] = dict(row)
+    finally:
+        conn.close()
+    return cached
+
+
+def save_cached_decisions(batch, results):
+    """Store the Stage 1 decisions for a batch (jobs carry their cache_key)."""
+    keys_by_id = {job['id']: job['cache_key'] for job in batch}
+    now = int(time.time())
+    rows = [
+        (keys_by_id[r['job_id']], r['decision'], r.get('score'), r.get('reasoning'),
+         r.get('min_years'), r.get('max_years'), r.get('is_engineering'), now)
+        for r in results
+        if r.get('job_id') in keys_by_id and r.get('decision')
+    ]
+    if not rows:
+        return
+    conn = _open_decision_cache()
+    try:
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO decisions VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+    finally:
+        conn.close()
 
 
 def is_non_us_location(location):
@@ -153,23 +424,22 @@ def should_reject_with_regex(job_title, location=None):
     """
     Pre-filter jobs with regex to reject obvious non-matches.
 
+    Thin wrapper over classify_title() and is_non_us_location() for callers
+    that want a single verdict; the filter itself calls those two directly
+    so location is only checked for titles that survive.
+
     Note: Non-US locations are NOT rejected if they're for new grads/juniors.
     They're flagged as low priority instead.
 
     Returns: (should_reject: bool, reason: str, is_non_us: bool)
     """
-    # Check for seniority indicators
-    if REJECT_PATTERNS['seniority'].search(job_title):
-        match = REJECT_PATTERNS['seniority'].search(job_title)
-        return True, f"Seniority indicator: {match.group()}", False
-
-    # Check for non-engineering roles
-    if REJECT_PATTERNS['non_engineering'].search(job_title):
-        match = REJECT_PATTERNS['non_engineering'].search(job_title)
-        return True, f"Non-engineering role: {match.group()}", False
+    # Check for seniority indicators / non-engineering roles
+    reject_reason, _ = classify_title(job_title)
+    if reject_reason:
+        return True, reject_reason, False
 
     # Check if non-US (but don't reject yet - will be handled differently)
-    is_non_us, location_info = is_non_us_location(location)
+    is_non_us, _ = is_non_us_location(location)
 
     return False, None, is_non_us
 
@@ -180,144 +450,189 @@ def batch_jobs(jobs, batch_size=BATCH_SIZE):
         yield jobs[i:i + batch_size]
 
 
-def evaluate_batch_with_haiku(batch, client):
+def _tool_decisions(message, label=""):
+    """Return the decision list from a response's submit_decisions tool call."""
+    for block in message.content:
+        if block.type == "tool_use" and block.name == "submit_decisions":
+            return block.input.get("decisions", [])
+    print(f"    ⚠ {label}No submit_decisions call in response (stop_reason: {message.stop_reason})")
+    return []
+
+
+def _batch_api_call(fn, *args):
     """
-    STAGE 1: Evaluate a batch of jobs using Claude Haiku for obvious decisions.
+    Call a Message Batches endpoint, retrying transient failures with backoff.
 
-    Returns list of dicts with job_id, decision (ACCEPT/REVIEW/REJECT),
-    score, reason, experience info.
+    A batch can take hours to finish and is paid for once submitted, so a
+    network blip or overloaded API while polling or reading results waits and
+    tries again instead of abandoning the batch.
+    """
+    for attempt in range(BATCH_API_ATTEMPTS):
+        try:
+            return fn(*args)
+        except (APIConnectionError, InternalServerError, RateLimitError) as e:
+            if attempt == BATCH_API_ATTEMPTS - 1:
+                raise
+            delay = BATCH_POLL_INTERVAL * 2 ** attempt
+            print(f"    ⚠ {type(e).__name__}: {e} - retrying in {delay}s", flush=True)
+            time.sleep(delay)
+
+
+def run_message_batch(client, requests, label):
+    """
+    Run requests through the Message Batches API (50% cheaper, async).
 
-    Score thresholds:
-    - >= 0.7 = ACCEPT (clear new grad match)
-    - 0.5-0.7 = REVIEW (borderline, needs Sonnet)
-    - < 0.5 = REJECT (not suitable)
+    Submits every request at once, polls until the batch has ended, then
+    returns one parsed decision list per request, in request order ([] for
+    requests that failed) - the same shape evaluate_batch_with_haiku /
+    review_batch_with_sonnet return per call.
+
+    The batch id is printed on submission; if polling still fails after
+    retries, the error names the batch so its results can be fetched later.
     """
-    # Prepare jobs for Claude - include descriptions
-    jobs_for_claude = []
-    for job in batch:
-        # Truncate description to save tokens
-        desc = job.get("job_description", "")
-        if desc:
-            desc = desc[:2000]  # First 2000 chars should be enough
-
-        jobs_for_claude.append({
-            "job_id": job["id"],
-            "title": job["job_title"],
-            "location": job.get("location", ""),
-            "description": desc
-        })
-
-    prompt = f"""You are doing STAGE 1 filtering for a CS new grad (0-2 years experience) seeking software engineering roles.
+    message_batch = client.messages.batches.create(requests=[
+        {"custom_id": f"{label}-{i}", "params": params}
+        for i, params in enumerate(requests)
+    ])
+    batch_id = message_batch.id
+    print(f"  Submitted message batch {batch_id} ({len(requests)} requests), waiting for results...", flush=True)
+
+    def collect_results():
+        results = [[] for _ in requests]
+        for entry in client.messages.batches.results(batch_id):
+            index = int(entry.custom_id.rsplit('-', 1)[1])
+            if entry.result.type == "succeeded":
+                results[index] = _tool_decisions(entry.result.message, label=f"{label} ")
+            else:
+                print(f"    ✗ Request {entry.custom_id} {entry.result.type}")
+        return results
 
-Your job: Make obvious decisions. Send borderline cases to REVIEW for deeper analysis.
+    try:
+        while message_batch.processing_status != "ended":
+            time.sleep(BATCH_POLL_INTERVAL)
+            message_batch = _batch_api_call(client.messages.batches.retrieve, batch_id)
+            counts = message_batch.request_counts
+            print(f"    {counts.processing} processing, {counts.succeeded} succeeded, {counts.errored} errored", flush=True)
 
-SCORING CRITERIA:
+        return _batch_api_call(collect_results)
+    except Exception:
+        print(f"  ✗ Lost track of message batch {batch_id}; it keeps running and its results "
+              f"stay retrievable with client.messages.batches.results('{batch_id}')", flush=True)
+        raise
 
-ACCEPT (score >= 0.7) - Clear new grad matches:
-1. Explicitly says "New Grad", "Entry Level", "Junior", or "0-2 years experience" (score 0.9-1.0)
-2. Engineering role (SWE, ML, Data, DevOps, Backend, Frontend, Fullstack) with NO experience mentioned (score 0.7-0.8)
-3. Has "Associate Engineer" or similar entry-level titles (score 0.8)
-4. Internships (score 0.7+)
 
-REVIEW (score 0.5-0.7) - Borderline cases needing human-level judgment:
-- Engineering role asking for "1-3 years" - possibly flexible (score 0.6)
-- Engineering role with "3-5 years" - might accept strong candidates (score 0.5)
-- Unclear experience requirements but reasonable tech stack (score 0.5-0.6)
-- Ambiguous titles or descriptions
+def _experience_excerpt(desc):
+    """Cut a description down to the experience/seniority spans Haiku scores on.
 
-REJECT (score < 0.5) - Clearly not suitable:
-- Explicitly requires "5+ years" (score 0.1)
-- Contains seniority keywords: "Senior", "Staff", "Principal", "Lead" (score 0.0)
-- Non-engineering role (Sales, Marketing, Product Manager, etc.) (score 0.0)
-- Clearly NOT suitable for new grads
+    Falls back to the opening of the description when no keyword matches.
+    """
+    if not desc:
+        return ""
+    snippets = []
+    covered = 0  # end of the previous snippet; keywords inside it are skipped
+    for m in EXPERIENCE_KEYWORD_PATTERN.finditer(desc):
+        if m.start() < covered:
+            continue
+        start = max(covered, m.start() - EXPERIENCE_CONTEXT_CHARS, desc.rfind('\n', 0, m.start()) + 1)
+        line_end = desc.find('\n', m.end())
+        end = min(m.end() + EXPERIENCE_CONTEXT_CHARS, len(desc) if line_end == -1 else line_end)
+        snippets.append(desc[start:end].strip())
+        if len(snippets) == MAX_EXPERIENCE_SNIPPETS:
+            break
+        covered = end
+    return " ... ".join(snippets) or desc[:500]
 
-JOBS TO EVALUATE:
-{json.dumps(jobs_for_claude, indent=2)}
 
-Return JSON array with ACCEPT/REVIEW/REJECT decisions:
+def _job_excerpt(job):
+    """Return the job's experience excerpt, computed once and kept on the job.
 
-[
-  {{
-    "job_id": 123,
-    "decision": "ACCEPT" | "REVIEW" | "REJECT",
-    "score": 0.0-1.0,
-    "min_years": 0-10 or null,
-    "max_years": 0-10 or null,
-    "is_engineering": true/false,
-    "reasoning": "Brief explanation"
-  }},
-  ...
-]
+    Both the decision cache key and the Haiku request use it.
+    """
+    excerpt = job.get("experience_excerpt")
+    if excerpt is None:
+        excerpt = job["experience_excerpt"] = _experience_excerpt(job.get("job_description"))
+    return excerpt
+
+
+def _haiku_request(batch):
+    """Build the Stage 1 messages.create() params for a batch of jobs."""
+    # Prepare jobs for Claude - include descriptions. Sent as a table
+    # (field names once + one row per job) so keys aren't repeated per job
+    jobs_for_claude = {
+        "columns": ["job_id", "title", "location", "description"],
+        "rows": [
+            [job["id"], job["job_title"], job.get("location", ""), _job_excerpt(job)]
+            for job in batch
+        ],
+    }
+
+    prompt = f"""JOBS TO EVALUATE (each row is one job, fields in "columns" order):
+{orjson.dumps(jobs_for_claude).decode()}"""
+
+    return {
+        "model": HAIKU_MODEL,
+        "max_tokens": 8000,
+        "tools": [HAIKU_DECISIONS_TOOL],
+        "tool_choice": {"type": "tool", "name": "submit_decisions"},
+        "system": [{
+            "type": "text",
+            "text": HAIKU_SYSTEM_PROMPT,
+            "cache_control": {"type": "ephemeral"}
+        }],
+        "messages": [{
+            "role": "user",
+            "content": prompt
+        }]
+    }
 
-Return ONLY the JSON array."""
 
-    try:
-        response = client.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=8000,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
-
-        # Parse response
-        response_text = response.content[0].text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            # Remove opening ```json or ```
-            response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
-            # Remove closing ```
-            if response_text.endswith('```'):
-                response_text = response_text.rsplit('```', 1)[0]
-            response_text = response_text.strip()
-
-        # Try to extract JSON if there's extra text
-        if response_text.startswith('['):
-            json_end = response_text.rfind(']') + 1
-            response_text = response_text[:json_end]
-
-        results = json.loads(response_text)
+def evaluate_batch_with_haiku(batch, client):
+    """
+    STAGE 1: Evaluate a batch of jobs using Claude Haiku for obvious decisions.
 
-        return results
+    Returns list of dicts with job_id, decision (ACCEPT/REVIEW/REJECT),
+    score, reason, experience info.
 
-    except json.JSONDecodeError as e:
-        print(f"    ⚠ JSON parse error: {e}")
-        print(f"    Response: {response_text[:200]}...")
-        return []
+    Score thresholds:
+    - >= 0.7 = ACCEPT (clear new grad match)
+    - 0.5-0.7 = REVIEW (borderline, needs Sonnet)
+    - < 0.5 = REJECT (not suitable)
+    """
+    try:
+        response = client.messages.create(**_haiku_request(batch))
+        return _tool_decisions(response)
     except Exception as e:
         print(f"    ✗ API error: {e}")
         return []
 
 
-def review_batch_with_sonnet(batch, client, profile):
-    """
-    STAGE 2: Review borderline jobs with Sonnet 4.5 using candidate profile.
+def _sonnet_request(batch, profile_json):
+    """Build the Stage 2 messages.create() params for a batch of REVIEW jobs.
 
-    Returns list of dicts with job_id, final_decision (ACCEPT/REJECT),
-    score, reason.
+    profile_json is the candidate profile serialized once per run, so every
+    batch sends a byte-identical system block.
     """
-    # Prepare jobs for Sonnet
-    jobs_for_sonnet = []
-    for job in batch:
-        # Include full description for Sonnet (worth the cost)
-        desc = job.get("job_description", "")
-
-        jobs_for_sonnet.append({
-            "job_id": job["job_id"],
-            "title": job["job_title"],
-            "company": job["company_name"],
-            "location": job.get("location", ""),
-            "description": desc[:3000],  # More context for Sonnet
-            "haiku_score": job.get("score", 0.5),
-            "haiku_reasoning": job.get("reasoning", "")
-        })
-
-    prompt = f"""You are making final decisions on borderline job postings for this candidate:
+    # Prepare jobs for Sonnet (same table layout as Stage 1)
+    jobs_for_sonnet = {
+        "columns": ["job_id", "title", "company", "location", "description",
+                    "haiku_score", "haiku_reasoning"],
+        "rows": [
+            [job["job_id"], job["job_title"], job["company_name"], job.get("location", ""),
+             # Include full description for Sonnet (worth the cost)
+             (job.get("job_description") or "")[:3000],
+             job.get("score", 0.5), job.get("reasoning", "")]
+            for job in batch
+        ],
+    }
+
+    # Rubric + profile are identical for every batch in a run; only the
+    # jobs change. The block is marked cache_control, but it stays below
+    # Sonnet's 1024-token minimum cacheable prefix unless the profile grows,
+    # so it is normally not cached
+    system_prompt = f"""You are making final decisions on borderline job postings for this candidate:
 
 CANDIDATE PROFILE:
-{json.dumps(profile, indent=2)}
+{profile_json}
 
 These jobs were flagged as REVIEW by the initial filter (scores 0.5-0.7). Your job: Decide if they're suitable matches.
 
@@ -339,55 +654,40 @@ REJECT if:
 - Role doesn't match candidate interests
 - Not actually an engineering role
 
-JOBS TO REVIEW:
-{json.dumps(jobs_for_sonnet, indent=2)}
-
-Return JSON array with final decisions:
-
-[
-  {{
-    "job_id": 123,
-    "decision": "ACCEPT" | "REJECT",
-    "score": 0.0-1.0,
-    "reasoning": "Why this is/isn't a good match for the candidate"
-  }},
-  ...
-]
+Submit one ACCEPT/REJECT decision per job with the submit_decisions tool."""
+
+    prompt = f"""JOBS TO REVIEW (each row is one job, fields in "columns" order):
+{orjson.dumps(jobs_for_sonnet).decode()}"""
+
+    return {
+        "model": "claude-sonnet-4-5-20250929",
+        "max_tokens": 8000,
+        "tools": [SONNET_DECISIONS_TOOL],
+        "tool_choice": {"type": "tool", "name": "submit_decisions"},
+        "system": [{
+            "type": "text",
+            "text": system_prompt,
+            "cache_control": {"type": "ephemeral"}
+        }],
+        "messages": [{
+            "role": "user",
+            "content": prompt
+        }]
+    }
+
+
+def review_batch_with_sonnet(batch, client, profile_json):
+    """
+    STAGE 2: Review borderline jobs with Sonnet 4.5 using candidate profile.
 
-Return ONLY the JSON array."""
+    profile_json is the profile as a JSON string (orjson.dumps(profile)).
 
+    Returns list of dicts with job_id, final_decision (ACCEPT/REJECT),
+    score, reason.
+    """
     try:
-        response = client.messages.create(
-            model="claude-sonnet-4-5-20250929",
-            max_tokens=8000,
-            messages=[{
-                "role": "user",
-                "content": prompt
-            }]
-        )
-
-        # Parse response
-        response_text = response.content[0].text.strip()
-
-        # Remove markdown code blocks if present
-        if response_text.startswith('```'):
-            response_text = response_text.split('\n', 1)[1] if '\n' in response_text else response_text[3:]
-            if response_text.endswith('```'):
-                response_text = response_text.rsplit('```', 1)[0]
-            response_text = response_text.strip()
-
-        # Extract JSON
-        if response_text.startswith('['):
-            json_end = response_text.rfind(']') + 1
-            response_text = response_text[:json_end]
-
-        results = json.loads(response_text)
-        return results
-
-    except json.JSONDecodeError as e:
-        print(f"    ⚠ Sonnet JSON parse error: {e}")
-        print(f"    Response: {response_text[:200]}...")
-        return []
+        response = client.messages.create(**_sonnet_request(batch, profile_json))
+        return _tool_decisions(response, label="Sonnet ")
     except Exception as e:
         print(f"    ✗ Sonnet API error: {e}")
         return []
@@ -408,89 +708,106 @@ def insert_target_jobs(all_jobs):
 
     p = _placeholder()
 
-    with get_connection() as conn:
-        cursor = conn.cursor()
-
-        stats = {'inserted': 0, 'accepted': 0, 'rejected': 0}
-        job_ids_to_mark = []
+    stats = {'inserted': 0, 'accepted': 0, 'rejected': 0}
+    target_rows = []
+    job_ids_to_mark = []
+
+    for job in all_jobs:
+        try:
+            decision = job.get("decision", "REJECT")
+
+            # Track stats
+            if decision == "ACCEPT":
+                stats['accepted'] += 1
+            elif decision == "REJECT":
+                stats['rejected'] += 1
+                # Mark as evaluated but DON'T insert into target_jobs
+                job_ids_to_mark.append((job["job_id"],))
+                continue
+            else:
+                # REVIEW - skip for now
+                continue
 
-        for job in all_jobs:
-            try:
-                decision = job.get("decision", "REJECT")
+            # Only insert ACCEPT jobs into target_jobs
+            # Determine priority: non-US jobs are low priority
+            priority = 3 if job.get("is_non_us", False) else 1
+
+            # Build experience analysis JSON
+            experience_info = {
+                "min_years": job.get("min_years"),
+                "max_years": job.get("max_years"),
+                "is_engineering": job.get("is_engineering"),
+                "decision": decision
+            }
+
+            target_rows.append((
+                job["job_id"],
+                job["score"],
+                job["reasoning"],
+                STATUS_PENDING,
+                priority,
+                job.get("is_intern", False),
+                orjson.dumps(experience_info).decode()
+            ))
+            # Accepted jobs already in target_jobs were evaluated before,
+            # so they can be marked too
+            job_ids_to_mark.append((job["job_id"],))
+
+        except Exception as e:
+            print(f"    ⚠ Error preparing job {job.get('job_id')}: {e}")
 
-                # Track stats
-                if decision == "ACCEPT":
-                    stats['accepted'] += 1
-                elif decision == "REJECT":
-                    stats['rejected'] += 1
-                    # Mark as evaluated but DON'T insert into target_jobs
-                    job_ids_to_mark.append(job["job_id"])
-                    continue
-                else:
-                    # REVIEW - skip for now
-                    continue
+    with get_connection() as conn:
+        cursor = conn.cursor()
 
-                # Only insert ACCEPT jobs into target_jobs
-                # Determine priority: non-US jobs are low priority
-                priority = 3 if job.get("is_non_us", False) else 1
-
-                # Build experience analysis JSON
-                experience_info = {
-                    "min_years": job.get("min_years"),
-                    "max_years": job.get("max_years"),
-                    "is_engineering": job.get("is_engineering"),
-                    "decision": decision
-                }
-
-                if is_remote():
-                    cursor.execute(f"""
-                        INSERT INTO target_jobs
-                        (job_id, relevance_score, match_reason, status, priority, is_intern, experience_analysis)
-                        VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
-                        ON CONFLICT (job_id) DO NOTHING
-                    """, (
-                        job["job_id"],
-                        job["score"],
-                        job["reasoning"],
-                        STATUS_PENDING,
-                        priority,
-                        job.get("is_intern", False),
-                        json.dumps(experience_info)
-                    ))
-                else:
-                    cursor.execute(f"""
-                        INSERT OR IGNORE INTO target_jobs
-                        (job_id, relevance_score, match_reason, status, priority, is_intern, experience_analysis)
-                        VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
-                    """, (
-                        job["job_id"],
-                        job["score"],
-                        job["reasoning"],
-                        STATUS_PENDING,
-                        priority,
-                        job.get("is_intern", False),
-                        json.dumps(experience_info)
-                    ))
-
-                if cursor.rowcount > 0:
-                    stats['inserted'] += 1
-                    job_ids_to_mark.append(job["job_id"])
-
-            except Exception as e:
-                print(f"    ⚠ Error inserting job {job['job_id']}: {e}")
+        # One statement per phase; get_connection() commits them as a single
+        # transaction
+        if target_rows:
+            if is_remote():
+                # psycopg2's executemany is still one round trip per row;
+                # execute_values packs pages of rows into multi-row VALUES,
+                # and RETURNING counts only rows that weren't duplicates
+                from psycopg2.extras import execute_values
+                inserted = execute_values(cursor, """
+                    INSERT INTO target_jobs
+                    (job_id, relevance_score, match_reason, status, priority, is_intern, experience_analysis)
+                    VALUES %s
+                    ON CONFLICT (job_id) DO NOTHING
+                    RETURNING job_id
+                """, target_rows, fetch=True)
+                stats['inserted'] = len(inserted)
+            else:
+                cursor.executemany(f"""
+                    INSERT OR IGNORE INTO target_jobs
+                    (job_id, relevance_score, match_reason, status, priority, is_intern, experience_analysis)
+                    VALUES ({p}, {p}, {p}, {p}, {p}, {p}, {p})
+                """, target_rows)
+                # executemany rowcount is the total across rows; ignored
+                # duplicates don't count
+                stats['inserted'] = cursor.rowcount
 
         # Mark all processed jobs as evaluated in jobs table
         if job_ids_to_mark:
-            placeholders = ','.join([p] * len(job_ids_to_mark))
-            cursor.execute(f"UPDATE jobs SET evaluated = 1 WHERE id IN ({placeholders})", job_ids_to_mark)
-
-        conn.commit()
-
-        return stats
-
-
-def filter_all_jobs():
-    """Main function: process all unprocessed jobs with description-based filtering."""
+            if is_remote():
+                # One statement with the ids as a single array parameter
+                cursor.execute(
+                    "UPDATE jobs SET evaluated = TRUE WHERE id = ANY(%s)",
+                    ([job_id for (job_id,) in job_ids_to_mark],)
+                )
+            else:
+                # One parameter per statement, so no SQL variable limit to hit
+                cursor.executemany(f"UPDATE jobs SET evaluated = 1 WHERE id = {p}", job_ids_to_mark)
+
+    return stats
+
+
+def filter_all_jobs(use_batch_api=False):
+    """Main function: process all unprocessed jobs with description-based filtering.
+
+    Args:
+        use_batch_api: Send each stage through the Message Batches API
+                       (half price, but results can take minutes to hours)
+                       instead of concurrent messages.create() calls.
+    """
     # Check for API key
     api_key = os.environ.get("ANTHROPIC_API_KEY")
     if not api_key:
@@ -498,33 +815,28 @@ def filter_all_jobs():
         print("Set it with: export ANTHROPIC_API_KEY='your-key-here'")
         return
 
-    client = Anthropic(api_key=api_key)
-
-    # Get unprocessed jobs
-    jobs = get_unprocessed_jobs()
-
-    if not jobs:
-        print("✓ No unprocessed jobs found - all jobs have been evaluated!")
-        return
-
-    total_jobs = len(jobs)
+    # Batches run concurrently, so 429s are expected at peaks; the SDK backs
+    # off (honoring retry-after) and retries instead of dropping the batch
+    client = Anthropic(api_key=api_key, max_retries=API_MAX_RETRIES)
 
     print("=" * 80)
-    print(f"Pre-filtering {total_jobs} jobs with regex...")
+    print("Pre-filtering unprocessed jobs with regex...")
     print("=" * 80)
 
-    # Pre-filter with regex (reject obvious non-matches)
+    # Pre-filter with regex (reject obvious non-matches) as rows stream in
     regex_rejected = []
     potentially_relevant = []
+    total_jobs = 0
 
-    for job in jobs:
-        # Detect intern-only jobs
-        intern_only = is_intern_only(job['job_title'])
+    for job in get_unprocessed_job_headers():
+        total_jobs += 1
 
-        # Check if should reject based on regex
-        should_reject, reason, is_non_us = should_reject_with_regex(job['job_title'], job.get('location'))
+        # Check title for rejection keywords and intern-only in one scan;
+        # location only matters for jobs that survive
+        reason, intern_only = classify_title(job['job_title'])
+        is_non_us = False if reason else is_non_us_location(job.get('location'))[0]
 
-        if should_reject:
+        if reason:
             regex_rejected.append({
                 'job_id': job['id'],
                 'decision': 'REJECT',
@@ -542,6 +854,10 @@ def filter_all_jobs():
             job['is_non_us'] = is_non_us
             potentially_relevant.append(job)
 
+    if not total_jobs:
+        print("✓ No unprocessed jobs found - all jobs have been evaluated!")
+        return
+
     print(f"\n✓ Regex pre-filtering complete:")
     print(f"  ✗ Rejected: {len(regex_rejected)} ({len(regex_rejected)/total_jobs*100:.1f}%)")
     print(f"  → Sending to Claude: {len(potentially_relevant)} ({len(potentially_relevant)/total_jobs*100:.1f}%)")
@@ -557,11 +873,25 @@ def filter_all_jobs():
         print("\n✓ All jobs rejected by regex - no API calls needed!")
         return
 
-    batches = list(batch_jobs(potentially_relevant))
+    # Load descriptions only for the jobs Claude will actually read
+    descriptions = fetch_descriptions([job['id'] for job in potentially_relevant])
+    for job in potentially_relevant:
+        job['job_description'] = descriptions.get(job['id'])
+
+    # Reuse Stage 1 decisions for jobs whose exact Haiku input was seen before
+    for job in potentially_relevant:
+        job['cache_key'] = decision_cache_key(job)
+    cached = load_cached_decisions([job['cache_key'] for job in potentially_relevant])
+    cached_jobs = [job for job in potentially_relevant if job['cache_key'] in cached]
+    to_evaluate = [job for job in potentially_relevant if job['cache_key'] not in cached]
+
+    batches = list(batch_jobs(to_evaluate))
     num_batches = len(batches)
 
     print("\n" + "=" * 80)
-    print(f"Evaluating {len(potentially_relevant)} jobs with Claude Haiku (description analysis)")
+    if cached_jobs:
+        print(f"Reusing {len(cached_jobs)} cached Stage 1 decisions")
+    print(f"Evaluating {len(to_evaluate)} jobs with Claude Haiku (description analysis)")
     print(f"Batches: {num_batches} ({BATCH_SIZE} jobs per batch)")
     print("=" * 80)
 
@@ -572,120 +902,196 @@ def filter_all_jobs():
     total_processed = 0
     review_jobs = []  # Collect REVIEW jobs for Stage 2
 
-    for i, batch in enumerate(batches, 1):
-        print(f"\nBatch {i}/{num_batches}: Evaluating {len(batch)} jobs...")
-
-        results = evaluate_batch_with_haiku(batch, client)
-
-        if not results:
-            print(f"  ✗ Batch failed - skipping")
-            continue
-
-        # Add intern flags and location info from pre-processing
-        for result in results:
-            # Find corresponding job to get intern flag and location info
-            job = next((j for j in batch if j['id'] == result['job_id']), None)
-            if job:
-                result['is_intern'] = job.get('is_intern', False)
-                result['is_non_us'] = job.get('is_non_us', False)
-
-                # For REVIEW jobs, store full job data for Stage 2
-                if result.get('decision') == 'REVIEW':
-                    review_jobs.append({
-                        **job,  # Full job data
-                        **result  # Haiku's evaluation
-                    })
-
-        # Insert ACCEPT/REJECT jobs into database (REVIEW jobs skipped)
-        stats = insert_target_jobs(results)
-
-        # Count REVIEW jobs
-        review_count = sum(1 for r in results if r.get('decision') == 'REVIEW')
-
+    # Load candidate profile (Stage 2 can start during Stage 1), serialized
+    # once for every Sonnet batch
+    with open(PROFILE_PATH, 'rb') as f:
+        profile_json = orjson.dumps(orjson.loads(f.read())).decode()
+
+    # Apply cached decisions: ACCEPT/REJECT are inserted now, REVIEW jobs
+    # go on to Stage 2 like fresh ones
+    if cached_jobs:
+        cached_results = []
+        for job in cached_jobs:
+            row = cached[job['cache_key']]
+            result = {
+                'job_id': job['id'],
+                'decision': row['decision'],
+                'score': row['score'],
+                'reasoning': row['reasoning'],
+                'min_years': row['min_years'],
+                'max_years': row['max_years'],
+                'is_engineering': None if row['is_engineering'] is None else bool(row['is_engineering']),
+                'is_intern': job['is_intern'],
+                'is_non_us': job['is_non_us'],
+            }
+            if result['decision'] == 'REVIEW':
+                review_jobs.append({**job, **result})
+            cached_results.append(result)
+
+        stats = insert_target_jobs(cached_results)
         total_accepted += stats['accepted']
         total_rejected += stats['rejected']
-        total_review += review_count
-        total_processed += len(batch)
-
-        print(f"  ✓ Evaluated {len(results)} jobs:")
-        print(f"    ✓ ACCEPT: {stats['accepted']}")
-        print(f"    ⚠ REVIEW: {review_count} (will send to Sonnet)")
-        print(f"    ✗ REJECT: {stats['rejected']}")
-        print(f"  → Inserted {stats['inserted']} into target_jobs")
-
-        # Show progress
-        print(f"  Progress: {total_processed}/{len(potentially_relevant)} jobs processed")
-        print(f"  Running totals: {total_accepted} accepted, {total_review} review, {total_rejected} rejected")
-
-    print("\n" + "=" * 80)
-    print(f"STAGE 1 COMPLETE (Haiku) - {total_review} jobs need Stage 2 review")
-    print("=" * 80)
-
-    # STAGE 2: Sonnet review of borderline jobs
-    sonnet_accepted = 0
-    sonnet_rejected = 0
+        total_review += len(review_jobs)
+        print(f"\nCached: ✓ ACCEPT: {stats['accepted']}, ⚠ REVIEW: {len(review_jobs)}, ✗ REJECT: {stats['rejected']}")
+
+    # Stage 2 batches already sent to Sonnet, and their pending results
+    sonnet_batches = []
+    sonnet_futures = []
+
+    # Sonnet workers run alongside Stage 1: each full batch of REVIEW jobs is
+    # submitted as soon as Haiku produces it, so Sonnet latency hides under
+    # the remaining Haiku batches (concurrent mode only; --batch mode waits
+    # for Stage 1 to end)
+    with ThreadPoolExecutor(max_workers=SONNET_CONCURRENCY) as sonnet_executor:
+        # Up to HAIKU_CONCURRENCY batches are in flight at once; map() still
+        # hands results back in batch order so DB writes and output stay ordered
+        with ThreadPoolExecutor(max_workers=HAIKU_CONCURRENCY) as executor:
+            if use_batch_api:
+                # Empty when every job was a cache hit; the API rejects an
+                # empty Message Batch
+                batch_results = (
+                    run_message_batch(client, [_haiku_request(batch) for batch in batches], "haiku")
+                    if batches else []
+                )
+            else:
+                batch_results = executor.map(lambda batch: evaluate_batch_with_haiku(batch, client), batches)
+
+            for i, (batch, results) in enumerate(zip(batches, batch_results), 1):
+                print(f"\nBatch {i}/{num_batches}: Evaluated {len(batch)} jobs...")
+
+                if not results:
+                    print(f"  ✗ Batch failed - skipping")
+                    continue
 
-    if review_jobs:
-        print(f"\n{'='*80}")
-        print(f"STAGE 2: Reviewing {len(review_jobs)} borderline jobs with Sonnet 4.5")
-        print(f"Batches: {(len(review_jobs) + SONNET_BATCH_SIZE - 1) // SONNET_BATCH_SIZE} ({SONNET_BATCH_SIZE} jobs per batch)")
+                # Add intern flags and location info from pre-processing
+                jobs_by_id = {j['id']: j for j in batch}
+                for result in results:
+                    # Find corresponding job to get intern flag and location info
+                    job = jobs_by_id.get(result['job_id'])
+                    if job:
+                        result['is_intern'] = job.get('is_intern', False)
+                        result['is_non_us'] = job.get('is_non_us', False)
+
+                        # For REVIEW jobs, store full job data for Stage 2
+                        if result.get('decision') == 'REVIEW':
+                            review_jobs.append({
+                                **job,  # Full job data
+                                **result  # Haiku's evaluation
+                            })
+
+                save_cached_decisions(batch, results)
+
+                # Start Sonnet on every full batch of REVIEW jobs collected so far
+                if not use_batch_api:
+                    while len(review_jobs) - len(sonnet_batches) * SONNET_BATCH_SIZE >= SONNET_BATCH_SIZE:
+                        offset = len(sonnet_batches) * SONNET_BATCH_SIZE
+                        sonnet_batch = review_jobs[offset:offset + SONNET_BATCH_SIZE]
+                        sonnet_batches.append(sonnet_batch)
+                        sonnet_futures.append(
+                            sonnet_executor.submit(review_batch_with_sonnet, sonnet_batch, client, profile_json)
+                        )
+
+                # Insert ACCEPT/REJECT jobs into database (REVIEW jobs skipped)
+                stats = insert_target_jobs(results)
+
+                # Count REVIEW jobs
+                review_count = sum(1 for r in results if r.get('decision') == 'REVIEW')
+
+                total_accepted += stats['accepted']
+                total_rejected += stats['rejected']
+                total_review += review_count
+                total_processed += len(batch)
+
+                print(f"  ✓ Evaluated {len(results)} jobs:")
+                print(f"    ✓ ACCEPT: {stats['accepted']}")
+                print(f"    ⚠ REVIEW: {review_count} (will send to Sonnet)")
+                print(f"    ✗ REJECT: {stats['rejected']}")
+                print(f"  → Inserted {stats['inserted']} into target_jobs")
+
+                # Show progress
+                print(f"  Progress: {total_processed}/{len(to_evaluate)} jobs processed")
+                print(f"  Running totals: {total_accepted} accepted, {total_review} review, {total_rejected} rejected")
+
+        print("\n" + "=" * 80)
+        print(f"STAGE 1 COMPLETE (Haiku) - {total_review} jobs need Stage 2 review")
         print("=" * 80)
 
-        # Load candidate profile
-        with open(PROFILE_PATH, 'r') as f:
-            profile = json.load(f)
-
-        # Batch review jobs for Sonnet
-        sonnet_batches = list(batch_jobs(review_jobs, SONNET_BATCH_SIZE))
-
-        for i, batch in enumerate(sonnet_batches, 1):
-            print(f"\nSonnet Batch {i}/{len(sonnet_batches)}: Reviewing {len(batch)} jobs...")
-
-            sonnet_results = review_batch_with_sonnet(batch, client, profile)
-
-            if not sonnet_results:
-                print(f"  ✗ Batch failed - skipping")
-                continue
-
-            # Prepare results for insertion
-            final_jobs = []
-            for result in sonnet_results:
-                # Find original job data
-                job = next((j for j in batch if j['job_id'] == result['job_id']), None)
-                if job:
-                    final_jobs.append({
-                        'job_id': result['job_id'],
-                        'decision': result['decision'],
-                        'score': result['score'],
-                        'reasoning': f"Sonnet review: {result['reasoning']}",
-                        'is_intern': job.get('is_intern', False),
-                        'is_non_us': job.get('is_non_us', False),
-                        'min_years': job.get('min_years'),
-                        'max_years': job.get('max_years'),
-                        'is_engineering': job.get('is_engineering', True)
-                    })
-
-            # Insert Sonnet decisions
-            stats = insert_target_jobs(final_jobs)
-
-            sonnet_accepted += stats['accepted']
-            sonnet_rejected += stats['rejected']
-
-            print(f"  ✓ Reviewed {len(sonnet_results)} jobs:")
-            print(f"    ✓ ACCEPT: {stats['accepted']}")
-            print(f"    ✗ REJECT: {stats['rejected']}")
-            print(f"  → Inserted {stats['inserted']} into target_jobs")
-            print(f"  Running totals: {sonnet_accepted} accepted, {sonnet_rejected} rejected")
-
-        print(f"\n{'='*80}")
-        print(f"STAGE 2 COMPLETE (Sonnet)")
-        print(f"  ✓ Accepted: {sonnet_accepted}")
-        print(f"  ✗ Rejected: {sonnet_rejected}")
-        print("=" * 80)
+        # STAGE 2: Sonnet review of borderline jobs
+        sonnet_accepted = 0
+        sonnet_rejected = 0
+
+        if review_jobs:
+            print(f"\n{'='*80}")
+            print(f"STAGE 2: Reviewing {len(review_jobs)} borderline jobs with Sonnet 4.5")
+            print(f"Batches: {(len(review_jobs) + SONNET_BATCH_SIZE - 1) // SONNET_BATCH_SIZE} ({SONNET_BATCH_SIZE} jobs per batch)")
+            print("=" * 80)
+
+            # Batch the REVIEW jobs not yet sent (all of them in --batch
+            # mode, otherwise the final partial batch)
+            remaining = list(batch_jobs(review_jobs[len(sonnet_batches) * SONNET_BATCH_SIZE:], SONNET_BATCH_SIZE))
+            sonnet_batches.extend(remaining)
+
+            if use_batch_api:
+                batch_results = (
+                    run_message_batch(
+                        client, [_sonnet_request(batch, profile_json) for batch in sonnet_batches], "sonnet"
+                    )
+                    if sonnet_batches else []
+                )
+            else:
+                sonnet_futures.extend(
+                    sonnet_executor.submit(review_batch_with_sonnet, batch, client, profile_json)
+                    for batch in remaining
+                )
+                batch_results = (future.result() for future in sonnet_futures)
+
+            for i, (batch, sonnet_results) in enumerate(zip(sonnet_batches, batch_results), 1):
+                print(f"\nSonnet Batch {i}/{len(sonnet_batches)}: Reviewed {len(batch)} jobs...")
+
+                if not sonnet_results:
+                    print(f"  ✗ Batch failed - skipping")
+                    continue
 
-        # Update totals
-        total_accepted += sonnet_accepted
-        total_rejected += sonnet_rejected
+                # Prepare results for insertion
+                final_jobs = []
+                jobs_by_id = {j['job_id']: j for j in batch}
+                for result in sonnet_results:
+                    # Find original job data
+                    job = jobs_by_id.get(result['job_id'])
+                    if job:
+                        final_jobs.append({
+                            'job_id': result['job_id'],
+                            'decision': result['decision'],
+                            'score': result['score'],
+                            'reasoning': f"Sonnet review: {result['reasoning']}",
+                            'is_intern': job.get('is_intern', False),
+                            'is_non_us': job.get('is_non_us', False),
+                            'min_years': job.get('min_years'),
+                            'max_years': job.get('max_years'),
+                            'is_engineering': job.get('is_engineering', True)
+                        })
+
+                # Insert Sonnet decisions
+                stats = insert_target_jobs(final_jobs)
+
+                sonnet_accepted += stats['accepted']
+                sonnet_rejected += stats['rejected']
+
+                print(f"  ✓ Reviewed {len(sonnet_results)} jobs:")
+                print(f"    ✓ ACCEPT: {stats['accepted']}")
+                print(f"    ✗ REJECT: {stats['rejected']}")
+                print(f"  → Inserted {stats['inserted']} into target_jobs")
+                print(f"  Running totals: {sonnet_accepted} accepted, {sonnet_rejected} rejected")
+
+            print(f"\n{'='*80}")
+            print(f"STAGE 2 COMPLETE (Sonnet)")
+            print(f"  ✓ Accepted: {sonnet_accepted}")
+            print(f"  ✗ Rejected: {sonnet_rejected}")
+            print("=" * 80)
+
+            # Update totals
+            total_accepted += sonnet_accepted
+            total_rejected += sonnet_rejected
 
     # Final summary
     print("\n" + "=" * 80)
@@ -694,6 +1100,8 @@ def filter_all_jobs():
     print(f"Total jobs: {total_jobs}")
     print(f"  Regex rejected: {len(regex_rejected)} ({len(regex_rejected)/total_jobs*100:.1f}%)")
     print(f"  Haiku evaluated: {total_processed} ({total_processed/total_jobs*100:.1f}%)")
+    if cached_jobs:
+        print(f"  Cached decisions: {len(cached_jobs)} ({len(cached_jobs)/total_jobs*100:.1f}%)")
 
     print(f"\nStage 1 (Haiku) Results:")
     print(f"  ✓ Auto-accepted: {total_accepted - (sonnet_accepted if review_jobs else 0)}")
@@ -717,4 +1125,16 @@ def filter_all_jobs():
 
 
 if __name__ == "__main__":
-    filter_all_jobs()
+    parser = argparse.ArgumentParser(description="Filter jobs with two-stage Claude analysis")
+    parser.add_argument('--batch', action='store_true',
+                        help='Use the Message Batches API (50%% cheaper, asynchronous - may take hours)')
+    args = parser.parse_args()
+
+    # One connection for the whole run: the header stream, description
+    # lookup and every per-batch insert reuse it instead of reconnecting.
+    # Each batch still commits on its own, so decisions already paid for
+    # survive an interrupted run. Not in --batch mode: a connection left idle
+    # through hours of Message Batches polling can be dropped by the server
+    # (or Railway's proxy), failing every insert after the batch is paid for
+    with nullcontext() if args.batch else shared_connection():
+        filter_all_jobs(use_batch_api=args.batch)
@@ -8,7 +8,27 @@ This module provides:
 - Email body building with greeting
 """
 
-from urllib.parse import urlparse
+import re
+
+# Optional scheme and www., then the host up to any port, path, query or
+# fragment. The prefixes are possessive so a bare "https://" or "www." can't
+# backtrack into being read as the host.
+_DOMAIN_RE = re.compile(r'(?:https?://)?+(?:www\.)?+([^/:?#\s]+)', re.IGNORECASE)
+
+# Name titles skipped at the start and suffixes skipped at the end. Entries
+# have no trailing period; callers compare against word.rstrip('.')
+_TITLES = frozenset({
+    'dr', 'mr', 'mrs', 'ms', 'prof', 'professor', 'sir', 'madam', 'rev'
+})
+_SUFFIXES = frozenset({
+    'md', 'pe', 'phd', 'jr', 'sr', 'ii', 'iii', 'iv', 'mba', 'cpa', 'esq'
+})
+
+# Bullet line (already stripped): marker, optional spaces, then the item text
+_BULLET_RE = re.compile(r'[•*\-–—]\s*(.*)', re.DOTALL)
+
+# Strips everything str.isalnum() rejects (\w is alnum plus underscore)
+_strip_non_alnum = re.compile(r'[\W_]+').sub
 
 
 def extract_domain(website_url):
@@ -25,33 +45,13 @@ def extract_domain(website_url):
         website_url: URL string (may or may not have protocol)
 
     Returns:
-        Clean domain string, or None if extraction fails
+        Clean lowercase domain string, or None if extraction fails
     """
     if not website_url:
         return None
 
-    url = website_url.strip()
-
-    # Add protocol if missing (for urlparse to work)
-    if not url.startswith(('http://', 'https://')):
-        url = 'https://' + url
-
-    try:
-        parsed = urlparse(url)
-        domain = parsed.netloc or parsed.path.split('/')[0]
-
-        # Remove www. prefix
-        if domain.startswith('www.'):
-            domain = domain[4:]
-
-        # Remove port if present
-        if ':' in domain:
-            domain = domain.split(':')[0]
-
-        return domain if domain else None
-
-    except Exception:
-        return None
+    match = _DOMAIN_RE.match(website_url.strip())
+    return match.group(1).lower() if match else None
 
 
 def parse_name(full_name):
@@ -69,23 +69,14 @@ def parse_name(full_name):
     if not full_name:
         return None, None
 
-    # Titles to skip at the beginning
-    titles = {
-        'dr', 'dr.', 'mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.',
-        'prof', 'prof.', 'professor', 'sir', 'madam', 'rev', 'rev.'
-    }
-
-    # Suffixes to skip at the end
-    suffixes = {'md', 'pe', 'phd', 'jr', 'jr.', 'sr', 'sr.', 'ii', 'iii', 'iv', 'mba', 'cpa', 'esq', 'esq.'}
-
     parts = full_name.lower().strip().split()
 
     # Filter out titles from the beginning
-    while parts and (parts[0].rstrip('.') in titles or parts[0] in titles):
+    while parts and parts[0].rstrip('.') in _TITLES:
         parts.pop(0)
 
     # Filter out suffixes from the end
-    while parts and (parts[-1].rstrip('.') in suffixes or parts[-1] in suffixes):
+    while parts and parts[-1].rstrip('.') in _SUFFIXES:
         parts.pop()
 
     if not parts:
@@ -95,8 +86,8 @@ def parse_name(full_name):
     last = parts[-1] if len(parts) > 1 else None
 
     # Remove special characters
-    first = ''.join(c for c in first if c.isalnum())
-    last = ''.join(c for c in last if c.isalnum()) if last else None
+    first = _strip_non_alnum('', first)
+    last = _strip_non_alnum('', last) if last else None
 
     return first or None, last
 
@@ -176,56 +167,42 @@ def text_to_html(message_text):
     if not message_text:
         return ""
 
-    lines = message_text.split('\n')
     html_parts = []
     in_list = False
     current_paragraph = []
 
-    bullet_chars = ('•', '-', '*', '–', '—')
-
     def flush_paragraph():
         nonlocal current_paragraph
         if current_paragraph:
-            text = ' '.join(current_paragraph)
-            html_parts.append(f'<p>{text}</p>')
+            html_parts.append(f"<p>{' '.join(current_paragraph)}</p>")
             current_paragraph = []
 
-    for line in lines:
+    for line in message_text.split('\n'):
         stripped = line.strip()
 
         if not stripped:
-            # Empty line - flush paragraph
+            # Empty line - close list / flush paragraph
             if in_list:
                 html_parts.append('</ul>')
                 in_list = False
             flush_paragraph()
             continue
 
-        # Check if line is a bullet point
-        is_bullet = any(stripped.startswith(char) for char in bullet_chars)
+        # Bullet point: one anchored match gives the content after the marker
+        bullet = _BULLET_RE.match(stripped)
 
-        if is_bullet:
-            # Flush any pending paragraph
+        if bullet:
             flush_paragraph()
-
             if not in_list:
                 html_parts.append('<ul>')
                 in_list = True
-
-            # Extract bullet content (remove bullet char and whitespace)
-            for char in bullet_chars:
-                if stripped.startswith(char):
-                    content = stripped[len(char):].strip()
-                    break
-
-            html_parts.append(f'<li>{content}</li>')
+            html_parts.append(f'<li>{bullet.group(1)}</li>')
 
         else:
             # Regular text
             if in_list:
                 html_parts.append('</ul>')
                 in_list = False
-
             current_paragraph.append(stripped)
 
     # Close any open list
@@ -249,17 +226,11 @@ def extract_first_name(full_name):
     if not full_name:
         return None
 
-    # Common titles to skip
-    titles = {
-        'dr', 'dr.', 'mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.',
-        'prof', 'prof.', 'professor', 'sir', 'madam', 'rev', 'rev.'
-    }
-
     parts = full_name.strip().split()
 
     for part in parts:
         # Skip titles
-        if part.lower().rstrip('.') in titles or part.lower() in titles:
+        if part.lower().rstrip('.') in _TITLES:
             continue
         # Return first non-title word
         return part.capitalize()
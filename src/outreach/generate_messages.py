@@ -4,17 +4,20 @@
 This script:
 1. Loads your profile information
 2. Gets pending target jobs
-3. For each job, generates messages for each priority contact (or one generic if none)
+3. For each job, generates messages for each priority contact (or one generic if none),
+   several at a time
 4. Stores messages in database for review before sending
 
 Messages are unique per (company_id, job_id, contact_id) combination.
 contact_id can be NULL if no priority contacts exist for the company.
 """
 
-import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
+import orjson
 from anthropic import Anthropic
 from dotenv import load_dotenv
 
@@ -22,7 +25,7 @@ load_dotenv()
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from utils.jobs_db_conn import get_connection, is_remote
+from utils.jobs_db_conn import get_connection, shared_connection, is_remote
 
 
 def _placeholder():
@@ -32,8 +35,15 @@ def _placeholder():
 
 PROFILE_PATH = Path(__file__).parent.parent.parent / "profile.json"
 
+# SDK-level retries (exponential backoff) for rate limits / overloaded errors,
+# which concurrent generation in generate_all makes more likely
+API_MAX_RETRIES = 5
+
 # Initialize Claude API
-client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
+client = Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"), max_retries=API_MAX_RETRIES)
+
+# Messages generated in parallel by generate_all (each call is network-bound)
+MAX_CONCURRENT_GENERATIONS = 8
 
 
 def load_profile():
@@ -41,8 +51,7 @@ def load_profile():
     if not PROFILE_PATH.exists():
         raise FileNotFoundError(f"Profile not found at {PROFILE_PATH}. Please create profile.json with your info.")
 
-    with open(PROFILE_PATH, 'r') as f:
-        return json.load(f)
+    return orjson.loads(PROFILE_PATH.read_bytes())
 
 
 def get_pending_target_jobs(limit=None):
@@ -338,6 +347,22 @@ def generate_for_job(job_id, profile=None):
     return stats
 
 
+def _pending_generations(jobs):
+    """
+    Yield (index, job, contacts, contact, exists) for each message generate_all covers.
+
+    contacts is the job's priority contact list; when it is empty a single
+    generic slot is yielded with contact None. exists is True when the
+    message is already stored and only needs to be reported as skipped.
+    """
+    for i, job in enumerate(jobs, 1):
+        contacts = get_priority_contacts_for_company(job['company_id'])
+        for contact in contacts or [None]:
+            contact_id = contact['id'] if contact else None
+            exists = get_existing_message(job['company_id'], job['job_id'], contact_id) is not None
+            yield i, job, contacts, contact, exists
+
+
 def generate_all(profile=None, limit=None):
     """
     Generate messages for all pending target jobs.
@@ -346,6 +371,8 @@ def generate_all(profile=None, limit=None):
     - If priority contacts exist: one message per contact
     - If no priority contacts: one generic message (contact_id = NULL)
 
+    Up to MAX_CONCURRENT_GENERATIONS messages are generated at once.
+
     Args:
         profile: User profile dict (loaded if not provided)
         limit: Max messages to generate (None for all)
@@ -367,73 +394,65 @@ def generate_all(profile=None, limit=None):
     print("=" * 50)
 
     total_stats = {'generated': 0, 'skipped': 0, 'failed': 0}
-
-    for i, job in enumerate(jobs, 1):
-        if limit is not None and total_stats['generated'] >= limit:
-            print(f"\nLimit reached ({limit} messages)")
-            break
-
-        print(f"\n[{i}/{len(jobs)}] {job['company_name']}: {job['job_title'][:40]}")
-
-        contacts = get_priority_contacts_for_company(job['company_id'])
-
-        if not contacts:
-            # No contacts - generate generic message
-            existing = get_existing_message(job['company_id'], job['job_id'], None)
-            if existing:
-                print("  → Skipped (generic message exists)")
-                total_stats['skipped'] += 1
-                continue
-
-            context = f"Job: {job['job_title']}\nContact: None"
-            message = generate_message(
-                profile,
-                job['company_name'],
-                job.get('website'),
-                job['job_title'],
-                job.get('job_description'),
-                job.get('match_reason'),
-                None, None
-            )
-
-            if message:
-                store_message(job['company_id'], job['job_id'], None, message, context)
-                total_stats['generated'] += 1
-                print("  ✓ Generic message generated")
+    pending = _pending_generations(jobs)
+    last_index = None
+
+    def generate(task):
+        """Worker: return (status, message) for one slot; no DB access here."""
+        _, job, _, contact, exists = task
+        if exists:
+            return 'skipped', None
+        message = generate_message(
+            profile,
+            job['company_name'],
+            job.get('website'),
+            job['job_title'],
+            job.get('job_description'),
+            job.get('match_reason'),
+            contact['name'] if contact else None,
+            contact['title'] if contact else None
+        )
+        return ('generated' if message else 'failed'), message
+
+    # Claude calls run on worker threads; contact lookups, existence checks,
+    # store_message and all output stay on this thread's shared connection
+    with shared_connection(), ThreadPoolExecutor(max_workers=MAX_CONCURRENT_GENERATIONS) as executor:
+        while True:
+            # With a limit, only take as many slots as messages still needed;
+            # skipped and failed ones leave room for another round
+            if limit is None:
+                tasks = list(pending)
             else:
-                total_stats['failed'] += 1
-                print("  ✗ Failed")
-        else:
-            # Has contacts - generate per contact
-            print(f"  {len(contacts)} priority contacts")
-            for contact in contacts:
-                if limit is not None and total_stats['generated'] >= limit:
+                remaining = limit - total_stats['generated']
+                if remaining <= 0:
+                    print(f"\nLimit reached ({limit} messages)")
                     break
-
-                existing = get_existing_message(job['company_id'], job['job_id'], contact['id'])
-                if existing:
-                    total_stats['skipped'] += 1
-                    continue
-
-                context = f"Job: {job['job_title']}\nContact: {contact['name']} ({contact['title']})"
-                message = generate_message(
-                    profile,
-                    job['company_name'],
-                    job.get('website'),
-                    job['job_title'],
-                    job.get('job_description'),
-                    job.get('match_reason'),
-                    contact['name'],
-                    contact['title']
-                )
-
-                if message:
-                    store_message(job['company_id'], job['job_id'], contact['id'], message, context)
-                    total_stats['generated'] += 1
-                    print(f"    ✓ {contact['name']}")
+                tasks = list(islice(pending, remaining))
+            if not tasks:
+                break
+
+            # map() yields in task order, so output stays grouped by job
+            for (i, job, contacts, contact, _), (status, message) in zip(tasks, executor.map(generate, tasks)):
+                if i != last_index:
+                    print(f"\n[{i}/{len(jobs)}] {job['company_name']}: {job['job_title'][:40]}")
+                    if contacts:
+                        print(f"  {len(contacts)} priority contacts")
+                    last_index = i
+
+                total_stats[status] += 1
+
+                if status == 'skipped':
+                    if not contact:
+                        print("  → Skipped (generic message exists)")
+                elif status == 'generated':
+                    if contact:
+                        context = f"Job: {job['job_title']}\nContact: {contact['name']} ({contact['title']})"
+                    else:
+                        context = f"Job: {job['job_title']}\nContact: None"
+                    store_message(job['company_id'], job['job_id'], contact['id'] if contact else None, message, context)
+                    print(f"    ✓ {contact['name']}" if contact else "  ✓ Generic message generated")
                 else:
-                    total_stats['failed'] += 1
-                    print(f"    ✗ {contact['name']} - failed")
+                    print(f"    ✗ {contact['name']} - failed" if contact else "  ✗ Failed")
 
     return total_stats
 
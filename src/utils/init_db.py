@@ -36,6 +36,8 @@ def init_database(force=False):
 
     # Create database and apply schema
     conn = sqlite3.connect(DB_PATH)
+    # WAL is persistent, so set it once here for every later connection
+    conn.execute("PRAGMA journal_mode=WAL")
     cursor = conn.cursor()
     cursor.executescript(schema)
     conn.commit()
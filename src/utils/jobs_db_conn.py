@@ -11,10 +11,19 @@ Usage:
         cursor = conn.cursor()
         cursor.execute("SELECT * FROM companies")
         rows = cursor.fetchall()
+
+Long-running loops can wrap their work in shared_connection() so every
+get_connection() call inside reuses one open connection instead of
+reconnecting per query:
+
+    with shared_connection():
+        for company in companies:
+            process(company)  # calls get_connection() internally
 """
 
 import os
 import sqlite3
+import threading
 from pathlib import Path
 from contextlib import contextmanager
 from dotenv import load_dotenv
@@ -31,10 +40,62 @@ def is_remote():
     )
 
 
+# Applied to every SQLite connection. WAL with synchronous=NORMAL turns each
+# commit into a single WAL append (no fsync per commit) and lets readers run
+# alongside a writer; busy_timeout makes a second process (e.g. an aggregator
+# running while the filter reads) wait for the lock instead of failing fast;
+# the rest keep temp tables and hot pages in memory.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",     # 30 s
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",      # 64 MB page cache
+    "PRAGMA mmap_size=268435456",    # 256 MB memory-mapped I/O
+)
+
+# Per-thread connection reused by get_connection() inside shared_connection()
+_local = threading.local()
+
+
+def _connect(readonly=False):
+    """Open a new connection for the current environment."""
+    if is_remote():
+        import psycopg2
+        from psycopg2.extras import RealDictCursor
+        conn = psycopg2.connect(
+            os.environ.get("DATABASE_URL"),
+            cursor_factory=RealDictCursor
+        )
+        if readonly:
+            conn.set_session(readonly=True)
+        return conn
+
+    db_path = Path(__file__).parent.parent.parent / "data" / "jobs.db"
+    # Statement cache is per connection and keyed by SQL text, so it only pays
+    # off when a connection is reused (see shared_connection)
+    if readonly:
+        conn = sqlite3.connect(f"{db_path.as_uri()}?mode=ro", uri=True, cached_statements=256)
+    else:
+        conn = sqlite3.connect(db_path, cached_statements=256)
+    conn.row_factory = sqlite3.Row
+    for pragma in SQLITE_PRAGMAS:
+        # journal_mode is a write; read-only connections use whatever is set
+        if readonly and pragma.startswith("PRAGMA journal_mode"):
+            continue
+        conn.execute(pragma)
+    return conn
+
+
 @contextmanager
-def get_connection():
+def get_connection(readonly=False):
     """Get database connection based on environment.
 
+    Args:
+        readonly: Open a read-only connection (SQLite mode=ro, PostgreSQL
+                  read-only session) for pure SELECT paths. Ignored inside
+                  shared_connection(), which reuses its open connection.
+
     Returns:
         Connection object (sqlite3.Connection or psycopg2.connection)
         - SQLite: rows accessible as dict-like objects via sqlite3.Row
@@ -45,21 +106,49 @@ def get_connection():
             cursor = conn.cursor()
             # ... do work ...
         # auto-commits and closes
+
+    Inside shared_connection() the thread's open connection is reused:
+    the block still commits on success (rolls back on error) but the
+    connection stays open.
     """
-    if is_remote():
-        import psycopg2
-        from psycopg2.extras import RealDictCursor
-        conn = psycopg2.connect(
-            os.environ.get("DATABASE_URL"),
-            cursor_factory=RealDictCursor
-        )
-    else:
-        db_path = Path(__file__).parent.parent.parent / "data" / "jobs.db"
-        conn = sqlite3.connect(db_path)
-        conn.row_factory = sqlite3.Row
+    shared = getattr(_local, 'conn', None)
+    if shared is not None:
+        try:
+            yield shared
+            shared.commit()
+        except BaseException:
+            shared.rollback()
+            raise
+        return
+
+    conn = _connect(readonly=readonly)
+    try:
+        yield conn
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@contextmanager
+def shared_connection():
+    """Reuse one connection for every get_connection() call in this thread.
+
+    Nested use is a no-op; the connection is closed when the outermost
+    block exits.
+
+    Usage:
+        with shared_connection():
+            ...  # get_connection() calls share a single connection
+    """
+    if getattr(_local, 'conn', None) is not None:
+        yield _local.conn
+        return
 
+    conn = _connect()
+    _local.conn = conn
     try:
         yield conn
         conn.commit()
     finally:
+        _local.conn = None
         conn.close()